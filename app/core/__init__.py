@@ -1,12 +1,6 @@
 """Core module containing configuration and database setup."""
 
-from app.core.config import settings
+from app.core.config import get_settings, settings
+from app.core.database import get_supabase_client
 
-try:
-    from app.core.database import get_supabase_client
-except Exception as e:
-    import logging
-    logging.warning(f"Failed to import database module: {e}")
-    get_supabase_client = None  # type: ignore
-
-__all__ = ["settings", "get_supabase_client"]
+__all__ = ["settings", "get_settings", "get_supabase_client"]
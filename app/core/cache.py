@@ -0,0 +1,125 @@
+"""
+In-process response cache for read-heavy endpoints.
+
+Entries live in a TTL cache keyed by (namespace, key). Routers cache
+list responses under their table name and invalidate the whole
+namespace from every endpoint that writes to that table.
+
+Concurrent misses for the same entry are coalesced: the first caller
+runs the fetch and later callers await the same in-flight task instead
+of issuing identical queries.
+
+The cache is per process; with several workers each keeps its own copy
+and writes only invalidate the local one, so readers on other workers
+may see data up to LIST_CACHE_TTL_SECONDS old.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Optional
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+
+_cache: TTLCache = TTLCache(
+    maxsize=settings.list_cache_maxsize,
+    ttl=settings.list_cache_ttl_seconds,
+)
+
+# In-flight fetches by (namespace, key), shared by concurrent misses
+_inflight: dict[tuple[str, Hashable], asyncio.Task] = {}
+
+# Bumped by invalidate() so fetches started before a write are not cached
+_generations: dict[str, int] = {}
+
+
+def get_cached(namespace: str, key: Hashable = None) -> Optional[Any]:
+    """
+    Return a cached value, or None on miss or expiry.
+
+    Args:
+        namespace: Cache namespace (typically a table name)
+        key: Entry key within the namespace
+
+    Returns:
+        Cached value or None
+    """
+    return _cache.get((namespace, key))
+
+
+def set_cached(namespace: str, key: Hashable, value: Any) -> None:
+    """
+    Store a value in the cache.
+
+    Args:
+        namespace: Cache namespace (typically a table name)
+        key: Entry key within the namespace
+        value: Value to cache
+    """
+    _cache[(namespace, key)] = value
+
+
+def invalidate(namespace: str) -> None:
+    """
+    Drop every cached entry in a namespace.
+
+    Call after any write to the underlying table.
+
+    Args:
+        namespace: Cache namespace to clear
+    """
+    _generations[namespace] = _generations.get(namespace, 0) + 1
+    for cache_key in [k for k in list(_cache.keys()) if k[0] == namespace]:
+        _cache.pop(cache_key, None)
+    # Later callers must not join a fetch that may predate the write
+    for cache_key in [k for k in _inflight if k[0] == namespace]:
+        _inflight.pop(cache_key, None)
+
+
+async def _fetch_and_store(
+    namespace: str, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Run fetch and cache its result unless the namespace was invalidated meanwhile."""
+    generation = _generations.get(namespace, 0)
+    value = await fetch()
+    if _generations.get(namespace, 0) == generation:
+        _cache[(namespace, key)] = value
+    return value
+
+
+async def get_or_fetch(
+    namespace: str, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Return a cached value, fetching it at most once across concurrent misses.
+
+    The fetch runs as its own task, so a caller that disconnects does not
+    cancel it for the others. Exceptions propagate to every waiter and
+    nothing is cached.
+
+    Args:
+        namespace: Cache namespace (typically a table name)
+        key: Entry key within the namespace
+        fetch: Zero-argument coroutine function producing the value
+
+    Returns:
+        Cached or freshly fetched value
+    """
+    cache_key = (namespace, key)
+    value = _cache.get(cache_key)
+    if value is not None:
+        return value
+
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_store(namespace, key, fetch))
+        _inflight[cache_key] = task
+
+        def _clear(done: asyncio.Task) -> None:
+            if _inflight.get(cache_key) is done:
+                del _inflight[cache_key]
+
+        task.add_done_callback(_clear)
+
+    return await asyncio.shield(task)
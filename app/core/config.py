@@ -5,7 +5,9 @@ This module handles environment variables and application settings.
 Load environment variables from .env file using python-dotenv.
 """
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -19,16 +21,57 @@ class Settings(BaseSettings):
     env: str = "development"
 
     # Supabase configuration (prepare for future integration)
+    enable_supabase: bool = True
     supabase_url: str = ""
     supabase_key: str = ""
 
-    class Config:
-        """Pydantic configuration."""
+    # Shared Supabase HTTP connection pool limits
+    supabase_max_connections: int = 100
+    supabase_max_keepalive_connections: int = 20
+    supabase_http2: bool = True
+
+    # Number of concurrent warm-up requests sent to Supabase on startup
+    warm_pool_size: int = 4
+
+    # Dashboard metrics cache TTL (0 disables caching)
+    dashboard_ttl_seconds: float = 10.0
+
+    # List endpoint (packages/receipts) response cache
+    list_cache_ttl_seconds: float = 15.0
+    list_cache_maxsize: int = 64
+
+    # Gzip responses at least this many bytes long (0 disables compression)
+    gzip_minimum_size: int = 1000
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
 
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the cached application settings.
+
+    The .env file is parsed and validated only once per process, and
+    modules read the import-time settings global below, so clearing
+    this cache does not reload configuration for them. If a frozen
+    settings module was generated at build time (see
+    app.core.freeze_settings), its values are used and the .env file
+    is not read at all.
+
+    Returns:
+        Settings instance
+    """
+    try:
+        from app.core._settings_frozen import VALUES
+    except ImportError:
+        return Settings()
+    return Settings(_env_file=None, **VALUES)
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -4,28 +4,40 @@ Database client initialization with Supabase integration.
 This module manages the Supabase client for database operations.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional, Any
 
+from fastapi import HTTPException, Request, status
+
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 # Attempt to import Supabase, handle missing dependencies gracefully
 try:
-    from supabase import Client, create_client
+    import httpx
+    from supabase import AsyncClient, AsyncClientOptions, acreate_client
     SUPABASE_AVAILABLE = True
 except ModuleNotFoundError as e:
     logger.warning(f"Supabase not available: {e}. Database operations will fail.")
     SUPABASE_AVAILABLE = False
-    Client = Any  # type: ignore
-    create_client = None  # type: ignore
+    httpx = None  # type: ignore
+    AsyncClient = Any  # type: ignore
+    AsyncClientOptions = None  # type: ignore
+    acreate_client = None  # type: ignore
 
 
+@lru_cache(maxsize=1)
 def _validate_supabase_credentials() -> tuple[str, str]:
     """
     Validate Supabase credentials are configured.
 
+    Settings are fixed for the lifetime of the process, so the validated
+    pair is cached after the first successful call (failures are not
+    cached and are re-checked on the next call).
+
     Returns:
         Tuple of (supabase_url, supabase_key)
 
@@ -49,37 +61,67 @@ def _validate_supabase_credentials() -> tuple[str, str]:
     return url, key
 
 
-def get_supabase_client() -> Client:
+# Lazy-loaded singleton client (initialized on first use)
+_client: Optional[AsyncClient] = None
+_http_client: Optional["httpx.AsyncClient"] = None
+_client_lock = asyncio.Lock()
+
+
+async def get_supabase_client() -> AsyncClient:
     """
-    Get or create a Supabase client instance.
+    Get the shared async Supabase client instance.
 
-    This function validates credentials and returns a ready-to-use Supabase client.
+    The client is created on first call and cached at module scope;
+    construction is guarded by a lock so a burst of concurrent first
+    requests still builds exactly one client. All Supabase services
+    (auth, postgrest) share one pooled httpx.AsyncClient, so requests
+    reuse keep-alive connections and never block the event loop.
 
     Returns:
-        Initialized Supabase client
+        Initialized async Supabase client
 
     Raises:
         ValueError: If Supabase credentials are not configured or Supabase is not available
 
     Example:
-        client = get_supabase_client()
+        client = await get_supabase_client()
         response = await client.table("users").select("*").execute()
     """
-    if not SUPABASE_AVAILABLE:
-        raise RuntimeError(
-            "Supabase client is not available due to missing dependencies (pyroaring). "
-            "Please install the full requirements or configure Supabase properly."
+    global _client, _http_client
+    if _client is not None:
+        return _client
+
+    # Serialize first-time construction so concurrent callers share one client
+    async with _client_lock:
+        if _client is not None:
+            return _client
+
+        if not settings.enable_supabase:
+            raise RuntimeError(
+                "Supabase integration is disabled (ENABLE_SUPABASE=false)."
+            )
+
+        if not SUPABASE_AVAILABLE:
+            raise RuntimeError(
+                "Supabase client is not available due to missing dependencies (pyroaring). "
+                "Please install the full requirements or configure Supabase properly."
+            )
+
+        url, key = _validate_supabase_credentials()
+        _http_client = httpx.AsyncClient(
+            http2=settings.supabase_http2,
+            limits=httpx.Limits(
+                max_connections=settings.supabase_max_connections,
+                max_keepalive_connections=settings.supabase_max_keepalive_connections,
+            ),
         )
-    
-    url, key = _validate_supabase_credentials()
-    return create_client(url, key)
-
-
-# Lazy-loaded singleton client (initialized on first use)
-_client: Optional[Client] = None
+        _client = await acreate_client(
+            url, key, options=AsyncClientOptions(httpx_client=_http_client)
+        )
+        return _client
 
 
-def init_supabase_client() -> Client:
+async def init_supabase_client() -> AsyncClient:
     """
     Initialize the singleton Supabase client.
 
@@ -87,12 +129,79 @@ def init_supabase_client() -> Client:
     and early credential validation.
 
     Returns:
-        Initialized Supabase client
+        Initialized async Supabase client
 
     Raises:
         ValueError: If Supabase credentials are not configured
     """
-    global _client
-    if _client is None:
-        _client = get_supabase_client()
-    return _client
+    return await get_supabase_client()
+
+
+async def close_supabase_client() -> None:
+    """Close the shared HTTP connection pool on application shutdown."""
+    global _client, _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _client = None
+    _http_client = None
+
+
+async def warm_supabase_client(client: AsyncClient, pool_size: int) -> None:
+    """
+    Open keep-alive connections to Supabase before serving traffic.
+
+    Fires pool_size cheap queries concurrently so the underlying HTTP
+    transport has warm sockets (DNS, TCP and TLS already done) when the
+    first real request arrives.
+
+    Args:
+        client: Initialized async Supabase client
+        pool_size: Number of concurrent warm-up requests
+    """
+    results = await asyncio.gather(
+        *(
+            client.table("packages").select("id").limit(1).execute()
+            for _ in range(pool_size)
+        ),
+        return_exceptions=True,
+    )
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        logger.warning(
+            f"Supabase warm-up: {len(failures)}/{pool_size} requests failed: {failures[0]}"
+        )
+
+
+async def get_db(request: Request) -> AsyncClient:
+    """
+    FastAPI dependency returning the Supabase client stored on app.state.
+
+    The client is created once during application startup (see the
+    lifespan handler in app.main) and shared by every request. If startup
+    initialization failed, initialization is retried here.
+
+    Args:
+        request: Incoming request (used to reach the application state)
+
+    Returns:
+        Initialized async Supabase client
+
+    Raises:
+        HTTPException: If the client cannot be initialized
+
+    Example:
+        async def handler(db: AsyncClient = Depends(get_db)): ...
+    """
+    client = getattr(request.app.state, "supabase", None)
+    if client is None:
+        # Startup initialization failed or was skipped; retry lazily
+        try:
+            client = await init_supabase_client()
+        except Exception as e:
+            logger.warning(f"Supabase client unavailable: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Supabase client not initialized. Verify SUPABASE_URL and SUPABASE_KEY in .env file.",
+            )
+        request.app.state.supabase = client
+    return client
@@ -0,0 +1,49 @@
+"""
+Build step that freezes application settings into a Python module.
+
+Run as part of a container/image build once the environment is final:
+
+    python -m app.core.freeze_settings
+
+This resolves settings exactly as the app would (environment variables
+and the .env file), then writes them to app/core/_settings_frozen.py.
+At startup config.get_settings() imports that module and skips the
+.env file read and parse entirely. Delete the file to go back to
+regular .env loading.
+
+The generated file contains credentials; it is git-ignored and must
+never be committed.
+"""
+
+from pathlib import Path
+
+from app.core.config import Settings
+
+FROZEN_SETTINGS_PATH = Path(__file__).with_name("_settings_frozen.py")
+
+
+def freeze_settings(path: Path = FROZEN_SETTINGS_PATH) -> Path:
+    """
+    Resolve current settings and write them to a frozen settings module.
+
+    Args:
+        path: Destination module path
+
+    Returns:
+        Path of the written module
+    """
+    values = Settings().model_dump()
+    lines = [
+        '"""Frozen application settings. Generated by app.core.freeze_settings; do not edit."""',
+        "",
+        "VALUES = {",
+        *(f"    {name!r}: {value!r}," for name, value in sorted(values.items())),
+        "}",
+        "",
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {freeze_settings()}")
@@ -1,44 +1,79 @@
 """
 FastAPI application entry point.
 
-This module initializes the FastAPI app, configures middleware (CORS),
+This module initializes the FastAPI app, configures middleware (CORS, gzip),
 and registers routers.
 """
 
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.core.config import settings
-from app.core.database import init_supabase_client
-from app.routers import auth, packages, receipts, dashboard, seed, seed_receipts
+from app.core.database import (
+    close_supabase_client,
+    init_supabase_client,
+    warm_supabase_client,
+)
+from app.routers import auth, packages, receipts, dashboard
+from app.routers._preflight import probe_missing_tables
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize, verify and warm the shared Supabase client on startup; close it on shutdown."""
+    app.state.supabase = None
+    app.state.missing_tables = frozenset()
+    if not settings.enable_supabase:
+        logger.info("Supabase integration disabled. Database operations will be unavailable.")
+    else:
+        try:
+            app.state.supabase = await init_supabase_client()
+        except Exception as e:
+            logger.warning(f"Failed to initialize Supabase client: {e}. Database operations will be unavailable.")
+
+    if app.state.supabase is not None:
+        app.state.missing_tables = await probe_missing_tables(app.state.supabase)
+        if app.state.missing_tables:
+            logger.error(
+                f"Missing database tables: {', '.join(sorted(app.state.missing_tables))}. "
+                "Please set up the database schema."
+            )
+
+    if app.state.supabase is not None and settings.warm_pool_size > 0:
+        await warm_supabase_client(app.state.supabase, settings.warm_pool_size)
+    yield
+    await close_supabase_client()
+
 
 # Initialize FastAPI application
 app = FastAPI(
     title="Backend API",
     description="Production-ready FastAPI backend",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-
-@app.on_event("startup")
-async def startup():
-    """Initialize Supabase client on startup if available."""
-    try:
-        init_supabase_client()
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Failed to initialize Supabase client: {e}. Database operations will be unavailable.")
-
 # Configure CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"),
+    allow_headers=("authorization", "content-type", "if-none-match", "prefer"),
+    expose_headers=("etag",),
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
+# Compress larger JSON bodies (list pages) for clients that accept gzip
+if settings.gzip_minimum_size > 0:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
+
 
 # Root endpoint
 @app.get("/")
@@ -53,13 +88,16 @@ async def root():
 
 
 # Register routers with /api prefix
-app.include_router(auth.router, prefix="/api")
-app.include_router(packages.router, prefix="/api")
-app.include_router(receipts.router, prefix="/api")
-app.include_router(dashboard.router, prefix="/api")
-app.include_router(seed.router, prefix="/api")
-app.include_router(seed_receipts.router, prefix="/api")
+ROUTERS = (auth.router, packages.router, receipts.router, dashboard.router)
+for router in ROUTERS:
+    app.include_router(router, prefix="/api")
+
+# Demo seed routers are never imported or registered in production
+if settings.env != "production":
+    from app.routers import seed, seed_receipts
 
+    for router in (seed.router, seed_receipts.router):
+        app.include_router(router, prefix="/api")
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,88 @@
+"""
+Opaque keyset-pagination cursors for list endpoints.
+
+Timestamps are not unique (a bulk insert stamps a whole batch with the
+same now()), so pages are ordered by (timestamp, id) and the cursor
+carries both. Clients treat it as an opaque token and pass it back
+unchanged.
+"""
+
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """
+    Build the cursor pointing just past a row.
+
+    Args:
+        timestamp: Row's ordering timestamp
+        row_id: Row's id (tiebreak for equal timestamps)
+
+    Returns:
+        URL-safe opaque cursor token
+    """
+    raw = f"{timestamp.isoformat()}{_SEPARATOR}{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Unpack a cursor produced by encode_cursor.
+
+    Both parts are validated before they reach a PostgREST filter: the
+    timestamp must carry a UTC offset (a naive one would be compared in
+    the database server's time zone) and the id must be a UUID.
+
+    Args:
+        cursor: Token from a previous page's next_cursor
+
+    Returns:
+        (timezone-aware timestamp, canonical row UUID)
+
+    Raises:
+        HTTPException: 400 if the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, row_id = raw.split(_SEPARATOR, 1)
+        parsed = datetime.fromisoformat(timestamp)
+        if parsed.tzinfo is None:
+            raise ValueError("cursor timestamp has no UTC offset")
+        return parsed, str(uuid.UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def keyset_filter(column: str, cursor: str) -> str:
+    """
+    Build the PostgREST or= filter selecting rows after the cursor.
+
+    Rows come after the cursor when (column, id) < (timestamp, row id)
+    in the (column desc, id desc) order.
+
+    Args:
+        column: Timestamp column the list is ordered by
+        cursor: Token from a previous page's next_cursor
+
+    Returns:
+        Filter expression for query.or_()
+
+    Raises:
+        HTTPException: 400 if the token is malformed
+    """
+    timestamp, row_id = decode_cursor(cursor)
+    # Values are quoted: ISO timestamps contain PostgREST-reserved '.' and ':'.
+    # Neither can contain '"' or ')' since decode_cursor parsed both.
+    ts = f'"{timestamp.isoformat()}"'
+    rid = f'"{row_id}"'
+    return f"{column}.lt.{ts},and({column}.eq.{ts},id.lt.{rid})"
@@ -0,0 +1,175 @@
+"""
+Shared error mapping for Supabase-backed routers.
+
+Translates exceptions raised by the Supabase client into HTTPExceptions
+using error codes and table-driven rules, so handlers share one classifier
+instead of repeating substring ladders.
+"""
+
+import logging
+import re
+from typing import Optional
+
+from fastapi import HTTPException, status
+from supabase_auth.errors import AuthApiError
+
+logger = logging.getLogger(__name__)
+
+# (pattern, status_code, detail) rules, checked in order
+ErrorRule = tuple[re.Pattern, int, str]
+
+SIGNUP_ERROR_RULES: tuple[ErrorRule, ...] = (
+    (
+        re.compile(r"user already exists|duplicate", re.IGNORECASE),
+        status.HTTP_409_CONFLICT,
+        "Email already registered",
+    ),
+    (
+        re.compile(r"invalid|password", re.IGNORECASE),
+        status.HTTP_400_BAD_REQUEST,
+        "Invalid email or password format",
+    ),
+)
+
+LOGIN_ERROR_RULES: tuple[ErrorRule, ...] = (
+    (
+        re.compile(r"invalid|credentials", re.IGNORECASE),
+        status.HTTP_401_UNAUTHORIZED,
+        "Invalid email or password",
+    ),
+)
+
+_CONNECTION_RE = re.compile(r"connect|getaddrinfo", re.IGNORECASE)
+
+
+def map_auth_error(
+    exc: Exception, rules: tuple[ErrorRule, ...], fallback_detail: str
+) -> HTTPException:
+    """
+    Map a Supabase Auth failure to an HTTPException.
+
+    Resolution order:
+    1. First matching rule → (status_code, detail)
+    2. AuthApiError → 400 with the Supabase message
+    3. Connection failure → 503
+    4. Anything else → 500 with fallback_detail
+
+    Args:
+        exc: Exception raised by the Supabase client
+        rules: Ordered (pattern, status_code, detail) rules for the endpoint
+        fallback_detail: Detail for unclassified errors
+
+    Returns:
+        HTTPException to raise
+    """
+    error_msg = str(exc)
+
+    for pattern, status_code, detail in rules:
+        if pattern.search(error_msg):
+            return HTTPException(status_code=status_code, detail=detail)
+
+    # Generic Auth error
+    if isinstance(exc, AuthApiError):
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_msg,
+        )
+
+    # Network/connection errors
+    if _CONNECTION_RE.search(error_msg):
+        logger.warning("Supabase connection failed. Verify SUPABASE_URL is correct.")
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Supabase service unavailable. Verify SUPABASE_URL in .env file.",
+        )
+
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=fallback_detail,
+    )
+
+
+# PostgREST / Postgres error codes, checked before falling back to the message text
+_TABLE_MISSING_CODES = frozenset({"PGRST205", "42P01"})
+_FUNCTION_MISSING_CODES = frozenset({"PGRST202", "42883"})
+_UNIQUE_VIOLATION_CODES = frozenset({"23505"})
+
+_TABLE_MISSING_RE = re.compile(r"could not find the table|pgrst205", re.IGNORECASE)
+_FUNCTION_MISSING_RE = re.compile(r"could not find the function|pgrst202", re.IGNORECASE)
+_DUPLICATE_RE = re.compile(r"unique|duplicate", re.IGNORECASE)
+
+
+def _matches(code, codes: frozenset, pattern: re.Pattern, error_msg: str) -> bool:
+    """Match on the structured error code when present, else on the message."""
+    if code:
+        return code in codes
+    return pattern.search(error_msg) is not None
+
+
+def is_table_missing(exc: Exception) -> bool:
+    """Return True if a Supabase query failed because its table does not exist."""
+    code = getattr(exc, "code", None)
+    return _matches(code, _TABLE_MISSING_CODES, _TABLE_MISSING_RE, "" if code else str(exc))
+
+
+def table_missing_error(resource: str) -> HTTPException:
+    """503 raised when a required table has not been created yet."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"{resource.capitalize()} table not configured. Please set up the database schema.",
+    )
+
+
+def map_supabase_error(
+    exc: Exception,
+    resource: str,
+    fallback_detail: str,
+    *,
+    conflict_detail: Optional[str] = None,
+    function_detail: Optional[str] = None,
+) -> HTTPException:
+    """
+    Map a Supabase (PostgREST) query failure to an HTTPException.
+
+    Resolution order:
+    1. Table missing → 503
+    2. RPC function missing → 503 (only if function_detail is given)
+    3. Unique violation → 409 (only if conflict_detail is given)
+    4. Anything else → 500 with fallback_detail
+
+    Args:
+        exc: Exception raised by the Supabase client
+        resource: Table name used in the "not configured" message
+        fallback_detail: Detail for unclassified errors
+        conflict_detail: Detail for unique constraint violations
+        function_detail: Detail for a missing RPC function
+
+    Returns:
+        HTTPException to raise
+    """
+    code = getattr(exc, "code", None)
+    error_msg = "" if code else str(exc)
+
+    if _matches(code, _TABLE_MISSING_CODES, _TABLE_MISSING_RE, error_msg):
+        return table_missing_error(resource)
+
+    if function_detail and _matches(
+        code, _FUNCTION_MISSING_CODES, _FUNCTION_MISSING_RE, error_msg
+    ):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=function_detail,
+        )
+
+    if conflict_detail and _matches(
+        code, _UNIQUE_VIOLATION_CODES, _DUPLICATE_RE, error_msg
+    ):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=conflict_detail,
+        )
+
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=fallback_detail,
+    )
@@ -0,0 +1,64 @@
+"""
+Conditional-GET helpers for cached list endpoints.
+
+List bodies are encoded once and cached together with a weak ETag,
+so a client polling with If-None-Match gets a bodiless 304 when
+nothing has changed. The tag is weak because GZipMiddleware may send
+the same body gzipped or identity-encoded, and those two
+representations are not byte-identical.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+# Short client-side freshness window; after it, clients revalidate with the ETag
+CACHE_CONTROL = "private, max-age=5"
+
+
+def encode_with_etag(body: str) -> tuple[bytes, str]:
+    """
+    Encode a JSON body and derive its ETag.
+
+    Args:
+        body: Encoded JSON response body
+
+    Returns:
+        (body bytes, weak ETag)
+    """
+    data = body.encode()
+    return data, f'W/"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (which may list several tags) against etag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def conditional_json_response(
+    body: bytes, etag: str, if_none_match: Optional[str]
+) -> Response:
+    """
+    Build a 200 JSON response, or a 304 if the client already has this body.
+
+    Args:
+        body: Encoded JSON response body
+        etag: ETag for body
+        if_none_match: Value of the request's If-None-Match header
+
+    Returns:
+        Response with ETag and Cache-Control headers
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
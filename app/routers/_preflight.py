@@ -0,0 +1,89 @@
+"""
+Startup check for the tables the API depends on.
+
+The lifespan hook probes every required table once and records the
+missing ones on app.state, so handlers learn about an unconfigured
+database from a set lookup instead of from a failed query.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from fastapi import Request
+
+from app.core.database import AsyncClient
+from app.routers._errors import is_table_missing, table_missing_error
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_TABLES = ("packages", "receipts")
+
+
+async def probe_missing_tables(
+    client: AsyncClient, tables: Iterable[str] = REQUIRED_TABLES
+) -> frozenset[str]:
+    """
+    Return the subset of tables that do not exist.
+
+    Each table is probed with a HEAD select, so no rows are transferred.
+    Errors other than "table missing" (e.g. network failures) are logged
+    and the table is assumed to exist.
+
+    Args:
+        client: Supabase client to probe with
+        tables: Table names to check
+
+    Returns:
+        Names of the missing tables
+    """
+    tables = tuple(tables)
+    results = await asyncio.gather(
+        *(
+            client.table(table).select("id", head=True).limit(1).execute()
+            for table in tables
+        ),
+        return_exceptions=True,
+    )
+
+    missing = set()
+    for table, result in zip(tables, results):
+        if not isinstance(result, Exception):
+            continue
+        if is_table_missing(result):
+            missing.add(table)
+        else:
+            logger.warning(f"Could not verify table '{table}': {result}")
+    return frozenset(missing)
+
+
+def require_table(table: str):
+    """
+    Build a dependency that 503s while a table is known to be missing.
+
+    Tables flagged at startup are re-probed on request, so creating the
+    table fixes the API without a restart.
+
+    Args:
+        table: Table the router reads from or writes to
+
+    Returns:
+        FastAPI dependency callable
+    """
+
+    async def dependency(request: Request) -> None:
+        missing = getattr(request.app.state, "missing_tables", frozenset())
+        if table not in missing:
+            return
+
+        client = request.app.state.supabase
+        if client is not None and table not in await probe_missing_tables(
+            client, (table,)
+        ):
+            logger.info(f"Table '{table}' is now available")
+            request.app.state.missing_tables = missing - {table}
+            return
+
+        raise table_missing_error(table)
+
+    return dependency
@@ -6,10 +6,11 @@ Implements signup and login endpoints for user authentication.
 
 import logging
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from supabase_auth.errors import AuthApiError
 
-from app.core.database import get_supabase_client
+from app.core.database import AsyncClient, get_db
+from app.routers._errors import LOGIN_ERROR_RULES, SIGNUP_ERROR_RULES, map_auth_error
 from app.schemas.auth import (
     LoginRequest,
     LoginResponse,
@@ -28,12 +29,13 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
     status_code=status.HTTP_201_CREATED,
     summary="User Signup",
 )
-async def signup(request: SignupRequest):
+async def signup(request: SignupRequest, db: AsyncClient = Depends(get_db)):
     """
     Create a new user account.
 
     Args:
         request: Signup request with email and password
+        db: Shared Supabase client
 
     Returns:
         SignupResponse with created user info
@@ -42,10 +44,8 @@ async def signup(request: SignupRequest):
         HTTPException: If email already exists or validation fails
     """
     try:
-        client = get_supabase_client()
-
         # Sign up user with Supabase Auth
-        response = client.auth.sign_up(
+        response = await db.auth.sign_up(
             {
                 "email": request.email,
                 "password": request.password,
@@ -68,72 +68,11 @@ async def signup(request: SignupRequest):
     except HTTPException:
         raise
     except AuthApiError as e:
-        error_msg = str(e).lower()
         logger.warning(f"Supabase Auth error during signup: {str(e)}")
-
-        # # Handle rate limiting
-        # if "rate limit" in error_msg:
-        #     raise HTTPException(
-        #         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        #         detail="Too many signup attempts. Please try again later.",
-        #     )
-
-        # Handle duplicate email
-        if "user already exists" in error_msg or "duplicate" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Email already registered",
-            )
-
-        # Handle validation errors
-        if "invalid" in error_msg or "password" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid email or password format",
-            )
-
-        # Generic Auth error
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
+        raise map_auth_error(e, SIGNUP_ERROR_RULES, "Failed to create user account")
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Signup error: {str(e)}", exc_info=True)
-
-        # Handle duplicate email
-        if "user already exists" in error_msg or "duplicate" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Email already registered",
-            )
-
-        # Handle validation errors
-        if "invalid" in error_msg or "password" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid email or password format",
-            )
-
-        # Network/connection errors
-        if (
-            "connect" in error_msg
-            or "connection" in error_msg
-            or "getaddrinfo" in error_msg
-        ):
-            logger.warning(
-                "Signup: Supabase connection failed. Verify SUPABASE_URL is correct."
-            )
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Supabase service unavailable. Verify SUPABASE_URL in .env file.",
-            )
-
-        # Generic error
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create user account",
-        )
+        raise map_auth_error(e, SIGNUP_ERROR_RULES, "Failed to create user account")
 
 
 @router.post(
@@ -142,12 +81,13 @@ async def signup(request: SignupRequest):
     status_code=status.HTTP_200_OK,
     summary="User Login",
 )
-async def login(request: LoginRequest):
+async def login(request: LoginRequest, db: AsyncClient = Depends(get_db)):
     """
     Authenticate a user and return tokens.
 
     Args:
         request: Login request with email and password
+        db: Shared Supabase client
 
     Returns:
         LoginResponse with access token, refresh token, and user info
@@ -156,10 +96,8 @@ async def login(request: LoginRequest):
         HTTPException: If credentials are invalid
     """
     try:
-        client = get_supabase_client()
-
         # Authenticate with Supabase Auth
-        response = client.auth.sign_in_with_password(
+        response = await db.auth.sign_in_with_password(
             {
                 "email": request.email,
                 "password": request.password,
@@ -186,55 +124,8 @@ async def login(request: LoginRequest):
     except HTTPException:
         raise
     except AuthApiError as e:
-        error_msg = str(e).lower()
         logger.warning(f"Supabase Auth error during login: {str(e)}")
-
-        # # Handle rate limiting
-        # if "rate limit" in error_msg:
-        #     raise HTTPException(
-        #         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        #         detail="Too many login attempts. Please try again later.",
-        #     )
-
-        # Handle invalid credentials
-        if "invalid" in error_msg or "credentials" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password",
-            )
-
-        # Generic Auth error
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
+        raise map_auth_error(e, LOGIN_ERROR_RULES, "Authentication failed")
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Login error: {str(e)}", exc_info=True)
-
-        # Handle invalid credentials
-        if "invalid" in error_msg or "credentials" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password",
-            )
-
-        # Network/connection errors
-        if (
-            "connect" in error_msg
-            or "connection" in error_msg
-            or "getaddrinfo" in error_msg
-        ):
-            logger.warning(
-                "Login: Supabase connection failed. Verify SUPABASE_URL is correct."
-            )
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Supabase service unavailable. Verify SUPABASE_URL in .env file.",
-            )
-
-        # Generic error
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication failed",
-        )
+        raise map_auth_error(e, LOGIN_ERROR_RULES, "Authentication failed")
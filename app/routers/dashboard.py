@@ -4,15 +4,35 @@ Dashboard router for metrics and analytics using Supabase.
 Provides aggregated metrics about packages and deliveries.
 """
 
+import asyncio
 import logging
+import time
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel, Field
 
-from app.core.database import get_supabase_client
+from app.core.config import settings
+from app.core.database import AsyncClient, get_db
+from app.routers._errors import map_supabase_error
+from app.routers._preflight import require_table
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["dashboard"],
+    dependencies=[Depends(require_table("packages"))],
+)
+
+# Stale-while-revalidate cache for dashboard metrics
+_cached_metrics: Optional["DashboardMetrics"] = None
+_cached_expires_at: float = 0.0
+_refresh_lock = asyncio.Lock()
+_refresh_task: Optional[asyncio.Task] = None
+
+# Stale metrics are served for at most this many TTLs past expiry; after
+# that requests fetch synchronously, so a persistent failure is reported
+_MAX_STALE_TTLS = 3
 
 
 class DashboardMetrics(BaseModel):
@@ -30,13 +50,62 @@ class DashboardMetrics(BaseModel):
     )
 
 
+async def _fetch_metrics(db: AsyncClient) -> DashboardMetrics:
+    """
+    Query per-status package counts and fold them into metrics.
+
+    Args:
+        db: Shared Supabase client
+
+    Returns:
+        Freshly computed DashboardMetrics
+    """
+    # Fetch per-status counts in a single round-trip
+    response = await db.rpc("package_status_counts").execute()
+
+    # Fold status counts into the dashboard metrics
+    counts = {}
+    for row in response.data or []:
+        counts[row["status"]] = row["count"]
+
+    return DashboardMetrics(
+        total_packages=sum(counts.values()),
+        active_routes=counts.get("in_transit", 0),
+        alerts_count=counts.get("delayed", 0),
+        completed_deliveries=counts.get("delivered", 0),
+    )
+
+
+async def _refresh_metrics(db: AsyncClient) -> DashboardMetrics:
+    """Fetch metrics and store them in the cache."""
+    global _cached_metrics, _cached_expires_at
+    metrics = await _fetch_metrics(db)
+    _cached_metrics = metrics
+    _cached_expires_at = time.monotonic() + settings.dashboard_ttl_seconds
+    return metrics
+
+
+def _cache_servable() -> bool:
+    """Whether cached metrics exist and are not too stale to serve."""
+    stale_limit = _cached_expires_at + _MAX_STALE_TTLS * settings.dashboard_ttl_seconds
+    return _cached_metrics is not None and time.monotonic() < stale_limit
+
+
+async def _refresh_metrics_in_background(db: AsyncClient) -> None:
+    """Refresh stale metrics; on failure keep serving the stale value until it is too old."""
+    try:
+        await _refresh_metrics(db)
+    except Exception as e:
+        logger.warning(f"Background dashboard metrics refresh failed: {e}")
+
+
 @router.get(
     "/metrics",
     response_model=DashboardMetrics,
     status_code=status.HTTP_200_OK,
     summary="Get Dashboard Metrics",
 )
-async def get_dashboard_metrics():
+async def get_dashboard_metrics(db: AsyncClient = Depends(get_db)):
     """
     Retrieve aggregated metrics for the dashboard.
 
@@ -46,58 +115,48 @@ async def get_dashboard_metrics():
     - alerts_count: Delayed packages
     - completed_deliveries: Delivered packages
 
+    Counts come from the package_status_counts() Postgres function
+    (see supabase/migrations), so all metrics cost one round-trip.
+    Results are cached for DASHBOARD_TTL_SECONDS; stale values are served
+    immediately while a background task refreshes them. Once they are more
+    than a few TTLs past expiry (e.g. refreshes keep failing), requests
+    fetch synchronously instead, so a database failure surfaces as an error.
+
+    Args:
+        db: Shared Supabase client
+
     Returns:
         DashboardMetrics with all metric counts
 
     Raises:
         HTTPException: If metrics retrieval fails
     """
+    global _refresh_task
+
+    # Serve cached metrics; refresh in the background once they are stale
+    if settings.dashboard_ttl_seconds > 0 and _cache_servable():
+        if time.monotonic() >= _cached_expires_at and (
+            _refresh_task is None or _refresh_task.done()
+        ):
+            _refresh_task = asyncio.create_task(_refresh_metrics_in_background(db))
+        return _cached_metrics
+
     try:
-        client = get_supabase_client()
-
-        # Get total packages count
-        total_response = client.table("packages").select(
-            "id", count="exact"
-        ).execute()
-        total_packages = total_response.count
-
-        # Get active routes (in_transit)
-        active_response = client.table("packages").select(
-            "id", count="exact"
-        ).eq("status", "in_transit").execute()
-        active_routes = active_response.count
-
-        # Get alerts (delayed)
-        alerts_response = client.table("packages").select(
-            "id", count="exact"
-        ).eq("status", "delayed").execute()
-        alerts_count = alerts_response.count
-
-        # Get completed deliveries
-        completed_response = client.table("packages").select(
-            "id", count="exact"
-        ).eq("status", "delivered").execute()
-        completed_deliveries = completed_response.count
-
-        return DashboardMetrics(
-            total_packages=total_packages,
-            active_routes=active_routes,
-            alerts_count=alerts_count,
-            completed_deliveries=completed_deliveries,
-        )
+        if settings.dashboard_ttl_seconds <= 0:
+            return await _fetch_metrics(db)
+
+        # Cold or expired cache: only one request fetches at a time
+        async with _refresh_lock:
+            # Another request may have refreshed while this one waited
+            if _cache_servable():
+                return _cached_metrics
+            return await _refresh_metrics(db)
 
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to retrieve dashboard metrics: {str(e)}", exc_info=True)
-
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Packages table not configured. Please set up the database schema.",
-            )
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve metrics",
+        raise map_supabase_error(
+            e,
+            "packages",
+            "Failed to retrieve metrics",
+            function_detail="Dashboard metrics function not configured. Please apply the database migrations.",
         )
@@ -6,18 +6,26 @@ and signal-based category detection.
 """
 
 import logging
-from datetime import datetime
+from typing import Optional, get_args
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
-from app.core.database import get_supabase_client
+from app.core.cache import get_or_fetch, invalidate
+from app.core.database import AsyncClient, get_db
+from app.routers._cursor import encode_cursor, keyset_filter
+from app.routers._errors import map_supabase_error
+from app.routers._http import conditional_json_response, encode_with_etag
+from app.routers._preflight import require_table
 from app.schemas.packages import (
+    PACKAGE_LIST_ADAPTER,
+    PackageBulkCreate,
     PackageCreate,
     PackageCategoryUpdate,
     PackageProcessSignals,
     PackageResponse,
     PackageStatus,
     PackageUpdate,
+    PackageUrgency,
     PackagesListResponse,
 )
 from app.services.category_detector import CategoryDetector
@@ -25,10 +33,126 @@ from app.services.priority_engine import PriorityEngine
 from app.services.zk_verifier import ZKVerifier
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/packages", tags=["packages"])
 
 TABLE_NAME = "packages"
 
+router = APIRouter(
+    prefix="/packages",
+    tags=["packages"],
+    dependencies=[Depends(require_table(TABLE_NAME))],
+)
+
+_CLASSIFY_FUNCTION_MISSING = (
+    "Package classification function not configured. "
+    "Please apply the database migrations."
+)
+
+# Only the columns PackageResponse exposes
+_PACKAGE_COLUMNS = ",".join(PackageResponse.model_fields)
+
+
+def _package_row(request: PackageCreate) -> dict:
+    """Build the insert row for a new package (last_updated defaults to now())."""
+    return {
+        "package_id": request.package_id,
+        "destination": request.destination,
+        "status": request.status,
+        "urgency": request.urgency,
+        "description": request.description,
+        "category": None,
+        "priority_label": None,
+    }
+
+
+async def _classify_package(
+    db: AsyncClient,
+    package_uuid: str,
+    signals: dict,
+    category: Optional[str],
+    missing_urgency_detail: str,
+) -> dict:
+    """
+    Store signals, category and priority_label in one round-trip.
+
+    Priority depends on the package's stored urgency, so the label is
+    computed for every urgency up front and the classify_package()
+    Postgres function picks the one matching the row while updating it.
+
+    Args:
+        db: Shared Supabase client
+        package_uuid: Package UUID
+        signals: Signal columns to store (absent keys are left unchanged)
+        category: Category to store
+        missing_urgency_detail: Error detail if the package has no urgency
+
+    Returns:
+        Updated package row
+
+    Raises:
+        HTTPException: If package not found or urgency is not set
+    """
+    priorities = {
+        urgency: PriorityEngine.compute(urgency, category)
+        for urgency in get_args(PackageUrgency)
+    }
+
+    response = await db.rpc(
+        "classify_package",
+        {
+            "p_id": package_uuid,
+            "p_signals": signals,
+            "p_category": category,
+            "p_priorities": priorities,
+        },
+    ).execute()
+
+    if response.data:
+        invalidate(TABLE_NAME)
+        return response.data[0]
+
+    # Nothing updated: find out whether the package is missing or has no urgency
+    lookup = await db.table(TABLE_NAME).select("urgency").eq(
+        "id", package_uuid
+    ).execute()
+
+    if not lookup.data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Package not found",
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=missing_urgency_detail,
+    )
+
+
+async def _fetch_packages_page(
+    db: AsyncClient, limit: int, cursor: Optional[str]
+) -> tuple[bytes, str]:
+    """Fetch one page of packages and return the encoded list response and its ETag."""
+    # Fetch one page of packages ordered by (last_updated, id) descending; id breaks
+    # ties between rows sharing a timestamp (e.g. one bulk insert)
+    query = db.table(TABLE_NAME).select(_PACKAGE_COLUMNS).order(
+        "last_updated", desc=True
+    ).order("id", desc=True).limit(limit)
+    if cursor is not None:
+        query = query.or_(keyset_filter("last_updated", cursor))
+    response = await query.execute()
+
+    packages = PACKAGE_LIST_ADAPTER.validate_python(response.data)
+
+    # A full page means there may be more rows to fetch
+    next_cursor = (
+        encode_cursor(packages[-1].last_updated, packages[-1].id) if len(packages) == limit else None
+    )
+
+    # Cache the encoded body so hits skip response serialization too
+    body = PackagesListResponse(
+        packages=packages, count=len(packages), next_cursor=next_cursor
+    ).model_dump_json()
+    return encode_with_etag(body)
+
 
 @router.get(
     "",
@@ -36,43 +160,51 @@ TABLE_NAME = "packages"
     status_code=status.HTTP_200_OK,
     summary="List All Packages",
 )
-async def list_packages():
+async def list_packages(
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncClient = Depends(get_db),
+):
     """
-    Retrieve all packages ordered by last_updated descending.
+    Retrieve a page of packages ordered by last_updated descending.
+
+    Uses keyset pagination on (last_updated, id): pass the previous page's
+    next_cursor as `cursor` to fetch the next page.
+
+    Responses carry an ETag; a request whose If-None-Match matches gets
+    304 Not Modified with no body.
+
+    The encoded JSON body is cached in-process for LIST_CACHE_TTL_SECONDS,
+    concurrent misses share one query, and every endpoint that writes to
+    the packages table invalidates it.
+
+    Args:
+        limit: Maximum number of packages to return
+        cursor: Opaque token from the previous page's next_cursor
+        if_none_match: ETag from a previous response; matching returns 304
+        db: Shared Supabase client
 
     Returns:
-        PackagesListResponse with list of packages and count
+        PackagesListResponse with the page of packages, its count and next_cursor
 
     Raises:
         HTTPException: If database query fails
     """
     try:
-        client = get_supabase_client()
-
-        # Fetch all packages ordered by last_updated descending
-        response = client.table(TABLE_NAME).select("*").order(
-            "last_updated", desc=True
-        ).execute()
-
-        packages = [PackageResponse(**pkg) for pkg in response.data]
-
-        return PackagesListResponse(packages=packages, count=len(packages))
+        # Concurrent misses for the same page share one query
+        body, etag = await get_or_fetch(
+            TABLE_NAME, (limit, cursor), lambda: _fetch_packages_page(db, limit, cursor)
+        )
+        return conditional_json_response(body, etag, if_none_match)
 
+    except HTTPException:
+        raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to list packages: {str(e)}", exc_info=True)
-
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Packages table not configured. Please set up the database schema.",
-            )
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve packages",
-        )
+        raise map_supabase_error(e, TABLE_NAME, "Failed to retrieve packages")
 
 
 @router.post(
@@ -81,12 +213,15 @@ async def list_packages():
     status_code=status.HTTP_201_CREATED,
     summary="Create Package",
 )
-async def create_package(request: PackageCreate):
+async def create_package(
+    request: PackageCreate, db: AsyncClient = Depends(get_db)
+):
     """
     Create a new package.
 
     Args:
         request: Package creation data with urgency and description
+        db: Shared Supabase client
 
     Returns:
         PackageResponse with created package
@@ -96,22 +231,13 @@ async def create_package(request: PackageCreate):
         HTTPException: If package creation fails
     """
     try:
-        client = get_supabase_client()
-
         # Prepare package data (category and priority_label are null on creation)
-        package_data = {
-            "package_id": request.package_id,
-            "destination": request.destination,
-            "status": request.status.value,
-            "urgency": request.urgency.value,
-            "description": request.description,
-            "category": None,
-            "priority_label": None,
-            "last_updated": datetime.utcnow().isoformat(),
-        }
+        package_data = _package_row(request)
 
         # Insert package into database
-        response = client.table(TABLE_NAME).insert(package_data).execute()
+        response = await db.table(TABLE_NAME).insert(package_data).select(
+            _PACKAGE_COLUMNS
+        ).execute()
 
         if not response.data:
             raise HTTPException(
@@ -119,32 +245,73 @@ async def create_package(request: PackageCreate):
                 detail="Failed to create package",
             )
 
+        invalidate(TABLE_NAME)
         created_package = response.data[0]
-        return PackageResponse(**created_package)
+        return created_package  # validated once, by response_model
 
     except HTTPException:
         raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to create package: {str(e)}", exc_info=True)
+        raise map_supabase_error(
+            e,
+            TABLE_NAME,
+            "Failed to create package",
+            conflict_detail="Package ID already exists",
+        )
 
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Packages table not configured. Please set up the database schema.",
-            )
 
-        # Handle unique constraint violation on package_id
-        if "unique" in error_msg or "duplicate" in error_msg:
+@router.post(
+    "/bulk",
+    response_model=list[PackageResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Packages in Bulk",
+)
+async def create_packages_bulk(
+    request: PackageBulkCreate, db: AsyncClient = Depends(get_db)
+):
+    """
+    Create many packages with a single insert.
+
+    The insert is one statement, so either every package is created or
+    none is (e.g. when any package_id already exists).
+
+    Args:
+        request: Packages to create (at most MAX_BULK_ITEMS)
+        db: Shared Supabase client
+
+    Returns:
+        List of PackageResponse for the created packages
+
+    Raises:
+        HTTPException: If package creation fails
+    """
+    try:
+        rows = [_package_row(item) for item in request.items]
+
+        # Insert all packages in one round-trip
+        response = await db.table(TABLE_NAME).insert(rows).select(
+            _PACKAGE_COLUMNS
+        ).execute()
+
+        if not response.data:
             raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Package ID already exists",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to create packages",
             )
 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create package",
+        invalidate(TABLE_NAME)
+        return response.data  # validated once, by response_model
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to bulk create packages: {str(e)}", exc_info=True)
+        raise map_supabase_error(
+            e,
+            TABLE_NAME,
+            "Failed to create packages",
+            conflict_detail="One or more package IDs already exist",
         )
 
 
@@ -153,30 +320,41 @@ async def create_package(request: PackageCreate):
     response_model=PackageResponse,
     status_code=status.HTTP_200_OK,
     summary="Update Package Status",
+    responses={204: {"description": "Updated; sent with Prefer: return=minimal"}},
 )
 @router.patch(
     "/{package_uuid}",
     response_model=PackageResponse,
     status_code=status.HTTP_200_OK,
     summary="Update Package Status",
+    responses={204: {"description": "Updated; sent with Prefer: return=minimal"}},
 )
-async def update_package(package_uuid: str, request: PackageUpdate):
+async def update_package(
+    package_uuid: str,
+    request: PackageUpdate,
+    prefer: Optional[str] = Header(None),
+    db: AsyncClient = Depends(get_db),
+):
     """
     Update a package's status.
 
+    Clients that do not need the updated row can send
+    `Prefer: return=minimal` to get 204 No Content instead, which skips
+    returning the row from the database.
+
     Args:
         package_uuid: Package UUID
         request: Status update data
+        prefer: Prefer header; "return=minimal" requests a 204 response
+        db: Shared Supabase client
 
     Returns:
-        PackageResponse with updated package
+        PackageResponse with updated package, or 204 for return=minimal
 
     Raises:
         HTTPException: If package not found or update fails
     """
     try:
-        client = get_supabase_client()
-
         # If no status provided, check if this might be a process payload sent to wrong endpoint
         if request.status is None:
             raise HTTPException(
@@ -185,15 +363,30 @@ async def update_package(package_uuid: str, request: PackageUpdate):
             )
 
         # Prepare update data
+        # (last_updated is set by the packages_touch_last_updated trigger)
         update_data = {
             "status": request.status,  # status is already a string
-            "last_updated": datetime.utcnow().isoformat(),
         }
 
+        if prefer and "return=minimal" in prefer:
+            # Only the matched-row count comes back, used for the 404 check
+            response = await db.table(TABLE_NAME).update(
+                update_data, count="exact", returning="minimal"
+            ).eq("id", package_uuid).execute()
+
+            if not response.count:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Package not found",
+                )
+
+            invalidate(TABLE_NAME)
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
+
         # Update package
-        response = client.table(TABLE_NAME).update(update_data).eq(
+        response = await db.table(TABLE_NAME).update(update_data).eq(
             "id", package_uuid
-        ).execute()
+        ).select(_PACKAGE_COLUMNS).execute()
 
         if not response.data:
             raise HTTPException(
@@ -201,27 +394,19 @@ async def update_package(package_uuid: str, request: PackageUpdate):
                 detail="Package not found",
             )
 
+        invalidate(TABLE_NAME)
         updated_package = response.data[0]
-        return PackageResponse(**updated_package)
+        return updated_package  # validated once, by response_model
 
     except HTTPException:
         raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to update package: {str(e)}", exc_info=True)
-
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Packages table not configured. Please set up the database schema.",
-            )
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update package: {str(e)}",
+        raise map_supabase_error(
+            e, TABLE_NAME, f"Failed to update package: {str(e)}"
         )
 
+
 @router.post(
     "/{package_uuid}/process",
     response_model=PackageResponse,
@@ -235,7 +420,9 @@ async def update_package(package_uuid: str, request: PackageUpdate):
     summary="Process Package with Structured Signals",
 )
 async def process_package(
-    package_uuid: str, signals: PackageProcessSignals
+    package_uuid: str,
+    signals: PackageProcessSignals,
+    db: AsyncClient = Depends(get_db),
 ):
     """
     Process package: accept structured signals, verify claims, detect category, compute priority.
@@ -250,12 +437,14 @@ async def process_package(
     5. If category detected:
        - Compute priority_label
     6. Save category and priority_label
+       (steps 3-6 are one classify_package() round-trip)
     7. Return updated package
 
     Args:
         package_uuid: Package UUID
         signals: Structured signal data for category detection
                  (includes optional claimed_product_type for ZK verification)
+        db: Shared Supabase client
 
     Returns:
         PackageResponse with updated package
@@ -264,29 +453,6 @@ async def process_package(
         HTTPException: If package not found or update fails
     """
     try:
-        client = get_supabase_client()
-
-        # Fetch package by id
-        fetch_response = client.table(TABLE_NAME).select("*").eq(
-            "id", package_uuid
-        ).execute()
-
-        if not fetch_response.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Package not found",
-            )
-
-        package = fetch_response.data[0]
-        urgency = package.get("urgency")
-
-        # Validate urgency exists before using it for category detection
-        if not urgency:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Package urgency is not set. Cannot detect category without urgency.",
-            )
-
         # Determine ZK verification status
         zk_verified_sender = signals.zk_verified_sender
         if signals.claimed_product_type:
@@ -299,62 +465,39 @@ async def process_package(
         signal_data = {
             "weight": signals.weight,
             "fragile": signals.fragile,
-            "sender_type": signals.sender_type.value if signals.sender_type else None,
+            "sender_type": signals.sender_type,
             "zk_verified_sender": zk_verified_sender,
         }
 
         # Detect category from structured signals
+        # (urgency does not take part in detection)
         detected_category = CategoryDetector.detect(
-            urgency=urgency,
+            urgency=None,
             weight=signals.weight,
             fragile=signals.fragile,
-            sender_type=signals.sender_type.value if signals.sender_type else None,
+            sender_type=signals.sender_type,
             zk_verified_sender=zk_verified_sender,
         )
 
-        # Compute priority_label if category is detected
-        priority_label = None
-        if detected_category:
-            priority_label = PriorityEngine.compute(urgency, detected_category)
-
-        # Prepare complete update data
-        update_data = {
-            **signal_data,
-            "category": detected_category,
-            "priority_label": priority_label,
-            "last_updated": datetime.utcnow().isoformat(),
-        }
-
-        # Update package
-        update_response = client.table(TABLE_NAME).update(update_data).eq(
-            "id", package_uuid
-        ).execute()
-
-        if not update_response.data:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update package after processing",
-            )
-
-        updated_package = update_response.data[0]
-        return PackageResponse(**updated_package)
+        # Save signals, category and urgency-based priority_label
+        updated_package = await _classify_package(
+            db,
+            package_uuid,
+            signal_data,
+            detected_category,
+            "Package urgency is not set. Cannot detect category without urgency.",
+        )
+        return updated_package  # validated once, by response_model
 
     except HTTPException:
         raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to process package: {str(e)}", exc_info=True)
-
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Packages table not configured. Please set up the database schema.",
-            )
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to process package",
+        raise map_supabase_error(
+            e,
+            TABLE_NAME,
+            "Failed to process package",
+            function_detail=_CLASSIFY_FUNCTION_MISSING,
         )
 
 
@@ -371,7 +514,9 @@ async def process_package(
     summary="Update Package Category and Priority",
 )
 async def update_package_category(
-    package_uuid: str, request: PackageCategoryUpdate
+    package_uuid: str,
+    request: PackageCategoryUpdate,
+    db: AsyncClient = Depends(get_db),
 ):
     """
     Manually set package category and compute priority.
@@ -379,11 +524,12 @@ async def update_package_category(
     Workflow:
     1. Update category
     2. Compute priority_label from urgency and category
-    3. Save both
+    3. Save both (single classify_package() round-trip)
 
     Args:
         package_uuid: Package UUID
         request: Category update data
+        db: Shared Supabase client
 
     Returns:
         PackageResponse with updated package
@@ -392,67 +538,23 @@ async def update_package_category(
         HTTPException: If package not found or update fails
     """
     try:
-        client = get_supabase_client()
-
-        # Fetch package to get urgency
-        fetch_response = client.table(TABLE_NAME).select("*").eq(
-            "id", package_uuid
-        ).execute()
-
-        if not fetch_response.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Package not found",
-            )
-
-        package = fetch_response.data[0]
-        urgency = package.get("urgency")
-
-        # Validate urgency exists
-        if not urgency:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Package urgency is not set. Cannot compute priority without urgency.",
-            )
-
-        # Compute priority label from urgency and new category
-        priority_label = PriorityEngine.compute(urgency, request.category.value)
-
-        # Prepare update data
-        update_data = {
-            "category": request.category.value,
-            "priority_label": priority_label,
-            "last_updated": datetime.utcnow().isoformat(),
-        }
-
-        # Update package
-        update_response = client.table(TABLE_NAME).update(update_data).eq(
-            "id", package_uuid
-        ).execute()
-
-        if not update_response.data:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update package category",
-            )
-
-        updated_package = update_response.data[0]
-        return PackageResponse(**updated_package)
+        # Save category and priority_label computed from the stored urgency
+        updated_package = await _classify_package(
+            db,
+            package_uuid,
+            {},
+            request.category,
+            "Package urgency is not set. Cannot compute priority without urgency.",
+        )
+        return updated_package  # validated once, by response_model
 
     except HTTPException:
         raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to update package category: {str(e)}", exc_info=True)
-
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Packages table not configured. Please set up the database schema.",
-            )
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update package category",
-        )
\ No newline at end of file
+        raise map_supabase_error(
+            e,
+            TABLE_NAME,
+            "Failed to update package category",
+            function_detail=_CLASSIFY_FUNCTION_MISSING,
+        )
@@ -1,28 +1,81 @@
 """
 Receipts router for managing ethical receipt data using Supabase.
 
-Implements CRUD operations for receipts with harm score calculation.
+Implements CRUD operations for receipts; harm_score is a generated column
+computed by Postgres from disaster_type.
 """
 
 import logging
-from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
-from app.core.database import get_supabase_client
+from app.core.cache import get_or_fetch, invalidate
+from app.core.database import AsyncClient, get_db
+from app.routers._cursor import encode_cursor, keyset_filter
+from app.routers._errors import map_supabase_error
+from app.routers._http import conditional_json_response, encode_with_etag
+from app.routers._preflight import require_table
 from app.schemas.receipts import (
+    RECEIPT_LIST_ADAPTER,
+    ReceiptBulkCreate,
     ReceiptCreate,
     ReceiptResponse,
     ReceiptStatus,
     ReceiptsListResponse,
 )
-from app.services.harm_score import HarmScoreCalculator
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/receipts", tags=["receipts"])
 
 TABLE_NAME = "receipts"
 
+router = APIRouter(
+    prefix="/receipts",
+    tags=["receipts"],
+    dependencies=[Depends(require_table(TABLE_NAME))],
+)
+
+# Only the columns ReceiptResponse exposes
+_RECEIPT_COLUMNS = ",".join(ReceiptResponse.model_fields)
+
+
+def _receipt_row(request: ReceiptCreate) -> dict:
+    """Build the insert row for a new receipt (timestamp and harm_score are set by Postgres)."""
+    return {
+        "receipt_id": request.receipt_id,
+        "package_id": request.package_id,
+        "proof_summary": request.proof_summary,
+        "status": request.status,
+        "disaster_type": request.disaster_type,
+    }
+
+
+async def _fetch_receipts_page(
+    db: AsyncClient, limit: int, cursor: Optional[str]
+) -> tuple[bytes, str]:
+    """Fetch one page of receipts and return the encoded list response and its ETag."""
+    # Fetch one page of receipts ordered by (timestamp, id) descending; id breaks
+    # ties between rows sharing a timestamp (e.g. one bulk insert)
+    query = db.table(TABLE_NAME).select(_RECEIPT_COLUMNS).order(
+        "timestamp", desc=True
+    ).order("id", desc=True).limit(limit)
+    if cursor is not None:
+        query = query.or_(keyset_filter("timestamp", cursor))
+    response = await query.execute()
+
+    receipts = RECEIPT_LIST_ADAPTER.validate_python(response.data)
+
+    # A full page means there may be more rows to fetch
+    next_cursor = (
+        encode_cursor(receipts[-1].timestamp, receipts[-1].id) if len(receipts) == limit else None
+    )
+
+    # Cache the encoded body so hits skip response serialization too
+    body = ReceiptsListResponse(
+        receipts=receipts, count=len(receipts), next_cursor=next_cursor
+    ).model_dump_json()
+    return encode_with_etag(body)
+
 
 @router.get(
     "",
@@ -30,43 +83,51 @@ TABLE_NAME = "receipts"
     status_code=status.HTTP_200_OK,
     summary="List All Receipts",
 )
-async def list_receipts():
+async def list_receipts(
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncClient = Depends(get_db),
+):
     """
-    Retrieve all receipts ordered by timestamp descending.
+    Retrieve a page of receipts ordered by timestamp descending.
+
+    Uses keyset pagination on (timestamp, id): pass the previous page's
+    next_cursor as `cursor` to fetch the next page.
+
+    Responses carry an ETag; a request whose If-None-Match matches gets
+    304 Not Modified with no body.
+
+    The encoded JSON body is cached in-process for LIST_CACHE_TTL_SECONDS,
+    concurrent misses share one query, and every endpoint that writes to
+    the receipts table invalidates it.
+
+    Args:
+        limit: Maximum number of receipts to return
+        cursor: Opaque token from the previous page's next_cursor
+        if_none_match: ETag from a previous response; matching returns 304
+        db: Shared Supabase client
 
     Returns:
-        ReceiptsListResponse with list of receipts and count
+        ReceiptsListResponse with the page of receipts, its count and next_cursor
 
     Raises:
         HTTPException: If database query fails
     """
     try:
-        client = get_supabase_client()
-
-        # Fetch all receipts ordered by timestamp descending
-        response = client.table(TABLE_NAME).select("*").order(
-            "timestamp", desc=True
-        ).execute()
-
-        receipts = [ReceiptResponse(**rcpt) for rcpt in response.data]
-
-        return ReceiptsListResponse(receipts=receipts, count=len(receipts))
+        # Concurrent misses for the same page share one query
+        body, etag = await get_or_fetch(
+            TABLE_NAME, (limit, cursor), lambda: _fetch_receipts_page(db, limit, cursor)
+        )
+        return conditional_json_response(body, etag, if_none_match)
 
+    except HTTPException:
+        raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to list receipts: {str(e)}", exc_info=True)
-
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Receipts table not configured. Please set up the database schema.",
-            )
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve receipts",
-        )
+        raise map_supabase_error(e, TABLE_NAME, "Failed to retrieve receipts")
 
 
 @router.post(
@@ -75,12 +136,15 @@ async def list_receipts():
     status_code=status.HTTP_201_CREATED,
     summary="Create Receipt",
 )
-async def create_receipt(request: ReceiptCreate):
+async def create_receipt(
+    request: ReceiptCreate, db: AsyncClient = Depends(get_db)
+):
     """
     Create a new receipt with harm score calculation.
 
     Args:
         request: Receipt creation data with optional disaster_type
+        db: Shared Supabase client
 
     Returns:
         ReceiptResponse with created receipt and calculated harm_score
@@ -89,22 +153,13 @@ async def create_receipt(request: ReceiptCreate):
         HTTPException: If receipt creation fails
     """
     try:
-        client = get_supabase_client()
-
-        # Calculate harm score from disaster type
-        harm_score = HarmScoreCalculator.calculate(request.disaster_type)
-
         # Prepare receipt data
-        receipt_data = {
-            "receipt_id": request.receipt_id,
-            "package_id": request.package_id,
-            "proof_summary": request.proof_summary,
-            "status": request.status.value,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        receipt_data = _receipt_row(request)
 
         # Insert receipt into database
-        response = client.table(TABLE_NAME).insert(receipt_data).execute()
+        response = await db.table(TABLE_NAME).insert(receipt_data).select(
+            _RECEIPT_COLUMNS
+        ).execute()
 
         if not response.data:
             raise HTTPException(
@@ -112,39 +167,78 @@ async def create_receipt(request: ReceiptCreate):
                 detail="Failed to create receipt",
             )
 
-        # Add harm_score to response (calculated, not from DB)
-        created_receipt = response.data[0]
-        created_receipt["harm_score"] = harm_score
+        invalidate(TABLE_NAME)
 
+        # harm_score comes back from the generated column
+        created_receipt = response.data[0]
         logger.info(
             f"Created receipt {request.receipt_id} "
-            f"(disaster={request.disaster_type}, harm_score={harm_score})"
+            f"(disaster={request.disaster_type}, harm_score={created_receipt['harm_score']})"
         )
-
-        created_receipt = response.data[0]
-        return ReceiptResponse(**created_receipt)
+        return created_receipt  # validated once, by response_model
 
     except HTTPException:
         raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to create receipt: {str(e)}", exc_info=True)
+        raise map_supabase_error(
+            e,
+            TABLE_NAME,
+            "Failed to create receipt",
+            conflict_detail="Receipt ID already exists",
+        )
 
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Receipts table not configured. Please set up the database schema.",
-            )
 
-        # Handle unique constraint violation on receipt_id
-        if "unique" in error_msg or "duplicate" in error_msg:
+@router.post(
+    "/bulk",
+    response_model=list[ReceiptResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Receipts in Bulk",
+)
+async def create_receipts_bulk(
+    request: ReceiptBulkCreate, db: AsyncClient = Depends(get_db)
+):
+    """
+    Create many receipts with a single insert.
+
+    The insert is one statement, so either every receipt is created or
+    none is (e.g. when any receipt_id already exists).
+
+    Args:
+        request: Receipts to create (at most MAX_BULK_ITEMS)
+        db: Shared Supabase client
+
+    Returns:
+        List of ReceiptResponse with calculated harm_score
+
+    Raises:
+        HTTPException: If receipt creation fails
+    """
+    try:
+        rows = [_receipt_row(item) for item in request.items]
+
+        # Insert all receipts in one round-trip
+        response = await db.table(TABLE_NAME).insert(rows).select(
+            _RECEIPT_COLUMNS
+        ).execute()
+
+        if not response.data:
             raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Receipt ID already exists",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to create receipts",
             )
 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create receipt",
+        invalidate(TABLE_NAME)
+        logger.info(f"Created {len(response.data)} receipts in bulk")
+        return response.data  # validated once, by response_model
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to bulk create receipts: {str(e)}", exc_info=True)
+        raise map_supabase_error(
+            e,
+            TABLE_NAME,
+            "Failed to create receipts",
+            conflict_detail="One or more receipt IDs already exist",
         )
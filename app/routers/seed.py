@@ -8,12 +8,14 @@ for testing category detection and priority computation.
 """
 
 import logging
-from datetime import datetime
+from dataclasses import dataclass
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.core.database import get_supabase_client
+from app.core.cache import invalidate
+from app.core.database import AsyncClient, get_db
+from app.routers._errors import map_supabase_error
 from app.schemas.packages import PackageResponse
 from app.services.category_detector import CategoryDetector
 from app.services.priority_engine import PriorityEngine
@@ -24,29 +26,20 @@ router = APIRouter(prefix="/seed", tags=["seed"])
 TABLE_NAME = "packages"
 
 
+@dataclass(frozen=True, slots=True)
 class DemoPackageData:
     """Holds demo package data for seeding."""
 
-    def __init__(
-        self,
-        package_id: str,
-        destination: str,
-        urgency: str,
-        status: str,
-        weight: Optional[float],
-        fragile: Optional[bool],
-        sender_type: Optional[str],
-    ):
-        self.package_id = package_id
-        self.destination = destination
-        self.urgency = urgency
-        self.status = status
-        self.weight = weight
-        self.fragile = fragile
-        self.sender_type = sender_type
-
-
-def _get_demo_packages() -> list[DemoPackageData]:
+    package_id: str
+    destination: str
+    urgency: str
+    status: str
+    weight: Optional[float]
+    fragile: Optional[bool]
+    sender_type: Optional[str]
+
+
+def _get_demo_packages() -> tuple[DemoPackageData, ...]:
     """
     Generate demo packages with varied combinations.
 
@@ -57,7 +50,7 @@ def _get_demo_packages() -> list[DemoPackageData]:
     - delayed + critical
     - delivered + low priority
     """
-    return [
+    demos = [
         # 1. Critical + Hospital + Fragile → high priority
         DemoPackageData(
             package_id="DEMO-001-HOSPITAL-CRIT",
@@ -160,6 +153,46 @@ def _get_demo_packages() -> list[DemoPackageData]:
         ),
     ]
 
+    # Keyed by package_id so an accidentally duplicated entry is seeded once
+    return tuple({pkg.package_id: pkg for pkg in demos}.values())
+
+
+def _demo_package_row(demo_pkg: DemoPackageData) -> dict:
+    """Build the insert row for a demo package, running category detection and priority."""
+    # Detect category using structured signals
+    category = CategoryDetector.detect(
+        urgency=demo_pkg.urgency,
+        weight=demo_pkg.weight,
+        fragile=demo_pkg.fragile,
+        sender_type=demo_pkg.sender_type,
+        zk_verified_sender=None,
+    )
+
+    # Compute priority_label based on urgency + category
+    priority_label = None
+    if category:
+        priority_label = PriorityEngine.compute(demo_pkg.urgency, category)
+
+    return {
+        "package_id": demo_pkg.package_id,
+        "destination": demo_pkg.destination,
+        "status": demo_pkg.status,
+        "urgency": demo_pkg.urgency,
+        "weight": demo_pkg.weight,
+        "fragile": demo_pkg.fragile,
+        "sender_type": demo_pkg.sender_type,
+        "zk_verified_sender": None,
+        "category": category,
+        "priority_label": priority_label,
+        "description": f"Demo package: {demo_pkg.sender_type}",
+    }
+
+
+# Static demo data and insert rows, built once at import
+# (detection and priority are pure functions of the static inputs)
+_DEMO_PACKAGES = _get_demo_packages()
+_DEMO_PACKAGE_ROWS = tuple(_demo_package_row(demo_pkg) for demo_pkg in _DEMO_PACKAGES)
+
 
 @router.post(
     "/packages",
@@ -167,7 +200,7 @@ def _get_demo_packages() -> list[DemoPackageData]:
     status_code=status.HTTP_201_CREATED,
     summary="Seed Demo Packages",
 )
-async def seed_packages():
+async def seed_packages(db: AsyncClient = Depends(get_db)):
     """
     Populate packages table with demo data.
 
@@ -176,9 +209,13 @@ async def seed_packages():
     - Includes structured signals (weight, fragile, sender_type)
     - Runs through category detection
     - Computes priority_label based on urgency + category
+      (both precomputed once at import; the demo set is static)
 
     Safety:
-    - Does NOT reinsert if package_id already exists (checks before insert)
+    - Does NOT reinsert if package_id already exists (ON CONFLICT DO NOTHING)
+
+    Args:
+        db: Shared Supabase client
 
     Returns:
         List of created PackageResponse objects
@@ -187,70 +224,35 @@ async def seed_packages():
         HTTPException: If database error occurs
     """
     try:
-        client = get_supabase_client()
-        demo_packages = _get_demo_packages()
-        created_packages = []
-
-        for demo_pkg in demo_packages:
-            # Check if package_id already exists
-            existing = client.table(TABLE_NAME).select("id").eq(
-                "package_id", demo_pkg.package_id
-            ).execute()
-
-            if existing.data:
-                logger.info(
-                    f"Package {demo_pkg.package_id} already exists, skipping."
-                )
-                continue
-
-            # Detect category using structured signals
-            category = CategoryDetector.detect(
-                urgency=demo_pkg.urgency,
-                weight=demo_pkg.weight,
-                fragile=demo_pkg.fragile,
-                sender_type=demo_pkg.sender_type,
-                zk_verified_sender=None,
-            )
+        # Rows (with category and priority_label) are precomputed at import
+        rows_to_insert = list(_DEMO_PACKAGE_ROWS)
+
+        # Insert every demo package in one round-trip; rows whose package_id
+        # already exists are skipped by ON CONFLICT DO NOTHING
+        response = await db.table(TABLE_NAME).upsert(
+            rows_to_insert, on_conflict="package_id", ignore_duplicates=True
+        ).execute()
+
+        created_ids = {row["package_id"] for row in response.data or []}
+        for row in rows_to_insert:
+            if row["package_id"] not in created_ids:
+                logger.info(f"Package {row['package_id']} already exists, skipping.")
 
-            # Compute priority_label based on urgency + category
-            priority_label = None
-            if category:
-                priority_label = PriorityEngine.compute(
-                    demo_pkg.urgency, category
-                )
-
-            # Prepare package data for insertion
-            package_data = {
-                "package_id": demo_pkg.package_id,
-                "destination": demo_pkg.destination,
-                "status": demo_pkg.status,
-                "urgency": demo_pkg.urgency,
-                "weight": demo_pkg.weight,
-                "fragile": demo_pkg.fragile,
-                "sender_type": demo_pkg.sender_type,
-                "zk_verified_sender": None,
-                "category": category,
-                "priority_label": priority_label,
-                "description": f"Demo package: {demo_pkg.sender_type}",
-                "last_updated": datetime.utcnow().isoformat(),
-            }
-
-            # Insert into database
-            response = client.table(TABLE_NAME).insert(package_data).execute()
-
-            if response.data:
-                created_packages.append(PackageResponse(**response.data[0]))
-                logger.info(
-                    f"Created demo package {demo_pkg.package_id} "
-                    f"(category={category}, priority={priority_label})"
-                )
-
-        if not created_packages:
+        if not created_ids:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="All demo packages already exist in database",
             )
 
+        # Rows are validated once, by response_model
+        created_packages = response.data
+        for row in created_packages:
+            logger.info(
+                f"Created demo package {row['package_id']} "
+                f"(category={row['category']}, priority={row['priority_label']})"
+            )
+
+        invalidate(TABLE_NAME)
         logger.info(
             f"Seeding complete: {len(created_packages)} packages created"
         )
@@ -259,17 +261,5 @@ async def seed_packages():
     except HTTPException:
         raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to seed packages: {str(e)}", exc_info=True)
-
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Packages table not configured. Please set up the database schema.",
-            )
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to seed packages",
-        )
+        raise map_supabase_error(e, TABLE_NAME, "Failed to seed packages")
@@ -8,14 +8,15 @@ for testing ethical receipt documentation and harm score calculation.
 """
 
 import logging
-from datetime import datetime
+from dataclasses import dataclass
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.core.database import get_supabase_client
+from app.core.cache import invalidate
+from app.core.database import AsyncClient, get_db
+from app.routers._errors import map_supabase_error
 from app.schemas.receipts import ReceiptResponse
-from app.services.harm_score import HarmScoreCalculator
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/seed", tags=["seed"])
@@ -23,25 +24,18 @@ router = APIRouter(prefix="/seed", tags=["seed"])
 TABLE_NAME = "receipts"
 
 
+@dataclass(frozen=True, slots=True)
 class DemoReceiptData:
     """Holds demo receipt data for seeding."""
 
-    def __init__(
-        self,
-        receipt_id: str,
-        package_id: str,
-        proof_summary: str,
-        status: str,
-        disaster_type: Optional[str] = None,
-    ):
-        self.receipt_id = receipt_id
-        self.package_id = package_id
-        self.proof_summary = proof_summary
-        self.status = status
-        self.disaster_type = disaster_type
-
-
-def _get_demo_receipts() -> list[DemoReceiptData]:
+    receipt_id: str
+    package_id: str
+    proof_summary: str
+    status: str
+    disaster_type: Optional[str] = None
+
+
+def _get_demo_receipts() -> tuple[DemoReceiptData, ...]:
     """
     Generate demo receipts with varied combinations and disaster types.
 
@@ -51,7 +45,7 @@ def _get_demo_receipts() -> list[DemoReceiptData]:
     - verified receipts for luxury items (no disaster)
     - mixed statuses and disaster types for different package types
     """
-    return [
+    demos = [
         # 1. Hospital Package - Verified Receipt - Flood (harm_score: 90)
         DemoReceiptData(
             receipt_id="RECEIPT-001-HOSPITAL",
@@ -134,6 +128,13 @@ def _get_demo_receipts() -> list[DemoReceiptData]:
         ),
     ]
 
+    # Keyed by receipt_id so an accidentally duplicated entry is seeded once
+    return tuple({rcpt.receipt_id: rcpt for rcpt in demos}.values())
+
+
+# Static demo data, built once at import
+_DEMO_RECEIPTS = _get_demo_receipts()
+
 
 @router.post(
     "/receipts",
@@ -141,7 +142,7 @@ def _get_demo_receipts() -> list[DemoReceiptData]:
     status_code=status.HTTP_201_CREATED,
     summary="Seed Demo Receipts",
 )
-async def seed_receipts():
+async def seed_receipts(db: AsyncClient = Depends(get_db)):
     """
     Populate receipts table with demo data.
 
@@ -150,7 +151,10 @@ async def seed_receipts():
     Each receipt is linked to a corresponding demo package.
 
     Safety:
-    - Does NOT reinsert if receipt_id already exists (checks before insert)
+    - Does NOT reinsert if receipt_id already exists (ON CONFLICT DO NOTHING)
+
+    Args:
+        db: Shared Supabase client
 
     Returns:
         List of created ReceiptResponse objects
@@ -159,53 +163,45 @@ async def seed_receipts():
         HTTPException: If database error occurs
     """
     try:
-        client = get_supabase_client()
-        demo_receipts = _get_demo_receipts()
-        created_receipts = []
-
-        for demo_rcpt in demo_receipts:
-            # Check if receipt_id already exists
-            existing = client.table(TABLE_NAME).select("id").eq(
-                "receipt_id", demo_rcpt.receipt_id
-            ).execute()
-
-            if existing.data:
-                logger.info(
-                    f"Receipt {demo_rcpt.receipt_id} already exists, skipping."
-                )
-                continue
-
-            # Calculate harm score from disaster type
-            harm_score = HarmScoreCalculator.calculate(demo_rcpt.disaster_type)
+        rows_to_insert = []
 
+        for demo_rcpt in _DEMO_RECEIPTS:
             # Prepare receipt data for insertion
-            receipt_data = {
+            rows_to_insert.append({
                 "receipt_id": demo_rcpt.receipt_id,
                 "package_id": demo_rcpt.package_id,
                 "proof_summary": demo_rcpt.proof_summary,
                 "status": demo_rcpt.status,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-
-            # Insert into database
-            response = client.table(TABLE_NAME).insert(receipt_data).execute()
-
-            if response.data:
-                # Add harm_score to response (calculated, not from DB)
-                receipt_obj = response.data[0]
-                receipt_obj["harm_score"] = harm_score
-                created_receipts.append(ReceiptResponse(**receipt_obj))
-                logger.info(
-                    f"Created demo receipt {demo_rcpt.receipt_id} "
-                    f"(disaster={demo_rcpt.disaster_type}, harm_score={harm_score}, package={demo_rcpt.package_id})"
-                )
-
-        if not created_receipts:
+                "disaster_type": demo_rcpt.disaster_type,
+            })
+
+        # Insert every demo receipt in one round-trip; rows whose receipt_id
+        # already exists are skipped by ON CONFLICT DO NOTHING
+        response = await db.table(TABLE_NAME).upsert(
+            rows_to_insert, on_conflict="receipt_id", ignore_duplicates=True
+        ).execute()
+
+        created_ids = {row["receipt_id"] for row in response.data or []}
+        for row in rows_to_insert:
+            if row["receipt_id"] not in created_ids:
+                logger.info(f"Receipt {row['receipt_id']} already exists, skipping.")
+
+        if not created_ids:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="All demo receipts already exist in database",
             )
 
+        # Rows (with harm_score from the generated column) are validated
+        # once, by response_model
+        created_receipts = response.data
+        for row in created_receipts:
+            logger.info(
+                f"Created demo receipt {row['receipt_id']} "
+                f"(disaster={row['disaster_type']}, harm_score={row['harm_score']}, package={row['package_id']})"
+            )
+
+        invalidate(TABLE_NAME)
         logger.info(
             f"Seeding complete: {len(created_receipts)} receipts created"
         )
@@ -214,17 +210,5 @@ async def seed_receipts():
     except HTTPException:
         raise
     except Exception as e:
-        error_msg = str(e).lower()
         logger.error(f"Failed to seed receipts: {str(e)}", exc_info=True)
-
-        # Handle table not found
-        if "could not find the table" in error_msg or "pgrst205" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Receipts table not configured. Please set up the database schema.",
-            )
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to seed receipts",
-        )
+        raise map_supabase_error(e, TABLE_NAME, "Failed to seed receipts")
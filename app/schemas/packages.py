@@ -5,54 +5,30 @@ Defines request and response models for package operations.
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Optional
+from typing import Literal, Optional, get_args
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
+# Upper bound on rows per bulk insert, keeps one request within PostgREST limits
+MAX_BULK_ITEMS = 1000
 
-class PackageStatus(str, Enum):
-    """Valid package status values."""
 
-    IN_TRANSIT = "in_transit"
-    DELIVERED = "delivered"
-    DELAYED = "delayed"
+# Allowed values; Literal types validate as plain strings (no Enum instances)
+PackageStatus = Literal["in_transit", "delivered", "delayed"]
 
+# Built once so status validation is a set lookup per request
+_STATUS_VALUES = frozenset(get_args(PackageStatus))
+_STATUS_CHOICES = ", ".join(get_args(PackageStatus))
 
-class PackageUrgency(str, Enum):
-    """Valid package urgency values."""
+PackageUrgency = Literal["critical", "preferred", "flexible"]
 
-    CRITICAL = "critical"
-    PREFERRED = "preferred"
-    FLEXIBLE = "flexible"
+PackageCategory = Literal["medicine", "clothes", "fancy"]
 
+PackagePriority = Literal["high", "medium", "low"]
 
-class PackageCategory(str, Enum):
-    """Valid package category values."""
-
-    MEDICINE = "medicine"
-    CLOTHES = "clothes"
-    FANCY = "fancy"
-
-
-class PackagePriority(str, Enum):
-    """Valid package priority values."""
-
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
-
-
-class SenderType(str, Enum):
-    """Valid sender type values."""
-
-    HOSPITAL = "hospital"
-    NGO = "ngo"
-    GOVT = "govt"
-    RETAIL = "retail"
-    LUXURY = "luxury"
-    WAREHOUSE = "warehouse"
-    BUSINESS = "business"
+SenderType = Literal[
+    "hospital", "ngo", "govt", "retail", "luxury", "warehouse", "business"
+]
 
 
 class PackageCreate(BaseModel):
@@ -66,15 +42,24 @@ class PackageCreate(BaseModel):
         None, description="Package description (for backward compatibility)"
     )
 
-    @field_validator("description")
+    @field_validator("description", mode="after")
     @classmethod
     def validate_description(cls, v: Optional[str]) -> Optional[str]:
         """Validate description is not empty string."""
-        if v is not None and isinstance(v, str) and v.strip() == "":
+        # v is already str or None here; isspace() checks without copying
+        if v is not None and (not v or v.isspace()):
             return None
         return v
 
 
+class PackageBulkCreate(BaseModel):
+    """Request model for creating many packages in one insert."""
+
+    items: list[PackageCreate] = Field(
+        ..., min_length=1, max_length=MAX_BULK_ITEMS, description="Packages to create"
+    )
+
+
 class PackageProcessSignals(BaseModel):
     """Request model for processing package with structured signals.
     
@@ -125,7 +110,7 @@ class PackageProcessSignals(BaseModel):
 class PackageUpdate(BaseModel):
     """Request model for updating a package."""
 
-    status: Optional[str] = Field(None, description="New package status")
+    status: Optional[PackageStatus] = Field(None, description="New package status")
     
     @field_validator("status", mode="before")
     @classmethod
@@ -138,13 +123,12 @@ class PackageUpdate(BaseModel):
         v_lower = str(v).lower().strip()
         
         # Map to valid enum values
-        valid_statuses = {"in_transit", "delivered", "delayed"}
-        if v_lower in valid_statuses:
+        if v_lower in _STATUS_VALUES:
             return v_lower
         
         # If not valid, raise error with helpful message
         raise ValueError(
-            f"Invalid status '{v}'. Must be one of: {', '.join(valid_statuses)}"
+            f"Invalid status '{v}'. Must be one of: {_STATUS_CHOICES}"
         )
 
 
@@ -182,4 +166,13 @@ class PackagesListResponse(BaseModel):
     """Response model for listing packages."""
 
     packages: list[PackageResponse] = Field(..., description="List of packages")
-    count: int = Field(..., description="Total number of packages")
+    count: int = Field(..., description="Number of packages in this page")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque token; pass as `cursor` to fetch the next page; null on the last page",
+    )
+
+
+# Validates a whole result set in one call instead of one model per row;
+# built once here so every caller reuses the same compiled schema
+PACKAGE_LIST_ADAPTER = TypeAdapter(list[PackageResponse])
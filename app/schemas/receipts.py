@@ -5,17 +5,15 @@ Defines request and response models for receipt operations.
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from app.schemas.packages import MAX_BULK_ITEMS
 
-class ReceiptStatus(str, Enum):
-    """Valid receipt status values."""
 
-    VERIFIED = "verified"
-    PENDING = "pending"
+# Allowed values; Literal types validate as plain strings (no Enum instances)
+ReceiptStatus = Literal["verified", "pending"]
 
 
 class ReceiptCreate(BaseModel):
@@ -30,6 +28,14 @@ class ReceiptCreate(BaseModel):
     )
 
 
+class ReceiptBulkCreate(BaseModel):
+    """Request model for creating many receipts in one insert."""
+
+    items: list[ReceiptCreate] = Field(
+        ..., min_length=1, max_length=MAX_BULK_ITEMS, description="Receipts to create"
+    )
+
+
 class ReceiptResponse(BaseModel):
     """Response model for a receipt."""
 
@@ -48,4 +54,13 @@ class ReceiptsListResponse(BaseModel):
     """Response model for listing receipts."""
 
     receipts: list[ReceiptResponse] = Field(..., description="List of receipts")
-    count: int = Field(..., description="Total number of receipts")
+    count: int = Field(..., description="Number of receipts in this page")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque token; pass as `cursor` to fetch the next page; null on the last page",
+    )
+
+
+# Validates a whole result set in one call instead of one model per row;
+# built once here so every caller reuses the same compiled schema
+RECEIPT_LIST_ADAPTER = TypeAdapter(list[ReceiptResponse])
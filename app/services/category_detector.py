@@ -7,13 +7,17 @@ Uses sender type, fragility, weight, and verification status.
 
 from typing import Optional
 
+# Sender groups used by the rules below
+_INSTITUTIONAL_SENDERS = frozenset({"hospital", "ngo", "govt"})
+_CLOTHES_SENDERS = frozenset({"retail", "warehouse", "business"})
+
 
 class CategoryDetector:
     """Detects package category from structured signals."""
 
     @staticmethod
     def detect(
-        urgency: str,
+        urgency: Optional[str],
         weight: Optional[float],
         fragile: Optional[bool],
         sender_type: Optional[str],
@@ -47,7 +51,7 @@ class CategoryDetector:
         # Rule 1: ZK-verified sender from institutional sources → medicine
         if (
             zk_verified_sender is True
-            and sender_type in ["hospital", "ngo", "govt"]
+            and sender_type in _INSTITUTIONAL_SENDERS
         ):
             return "medicine"
 
@@ -60,7 +64,7 @@ class CategoryDetector:
             return "fancy"
 
         # Rule 4: Retail/warehouse/business → clothes
-        if sender_type in ["retail", "warehouse", "business"]:
+        if sender_type in _CLOTHES_SENDERS:
             return "clothes"
 
         # No category detected
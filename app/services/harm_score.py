@@ -5,10 +5,26 @@ Provides disaster severity assessment based on disaster type.
 Harm Score represents urgency/severity of disaster at delivery destination.
 
 Scale: 0-100 (higher = greater urgency)
+
+The receipts.harm_score generated column
+(supabase/migrations/20261014000400_receipts_harm_score.sql) applies the
+same rules in Postgres; keep the two in sync.
 """
 
 from typing import Optional
 
+# Disaster type → harm score mapping (keys are lowercase)
+_DISASTER_SCORES = {
+    "earthquake": 95,
+    "flood": 90,
+    "cyclone": 85,
+    "landslide": 80,
+    "storm": 70,
+}
+
+# Baseline score for no / unknown disaster
+_BASELINE_SCORE = 10
+
 
 class HarmScoreCalculator:
     """Calculates harm score based on disaster type."""
@@ -41,19 +57,12 @@ class HarmScoreCalculator:
             score = HarmScoreCalculator.calculate(None)      # Returns 10
         """
         if not disaster_type or not isinstance(disaster_type, str):
-            return 10  # Baseline score for no disaster
-
-        # Normalize to lowercase for comparison
-        normalized_type = disaster_type.lower().strip()
-
-        # Disaster type → harm score mapping
-        disaster_scores = {
-            "earthquake": 95,
-            "flood": 90,
-            "cyclone": 85,
-            "landslide": 80,
-            "storm": 70,
-        }
-
-        # Return score if found, otherwise baseline
-        return disaster_scores.get(normalized_type, 10)
+            return _BASELINE_SCORE  # Baseline score for no disaster
+
+        # Already-normalized input skips the lower()/strip() copies
+        score = _DISASTER_SCORES.get(disaster_type)
+        if score is not None:
+            return score
+
+        # Normalize to lowercase for comparison; unknown types get the baseline
+        return _DISASTER_SCORES.get(disaster_type.lower().strip(), _BASELINE_SCORE)
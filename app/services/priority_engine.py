@@ -6,6 +6,16 @@ Computes priority labels based on urgency and category.
 
 from typing import Optional
 
+# (urgency, category) → priority label; flexible urgency is low for any category
+_PRIORITY_TABLE = {
+    ("critical", "medicine"): "high",
+    ("critical", "clothes"): "medium",
+    ("critical", "fancy"): "low",
+    ("preferred", "medicine"): "medium",
+    ("preferred", "clothes"): "low",
+    ("preferred", "fancy"): "low",
+}
+
 
 class PriorityEngine:
     """Evaluates package priority based on urgency and category."""
@@ -35,33 +45,9 @@ class PriorityEngine:
         if category is None:
             return None
 
-        # critical + medicine → high
-        if urgency == "critical" and category == "medicine":
-            return "high"
-
-        # critical + clothes → medium
-        if urgency == "critical" and category == "clothes":
-            return "medium"
-
-        # critical + fancy → low
-        if urgency == "critical" and category == "fancy":
-            return "low"
-
-        # preferred + medicine → medium
-        if urgency == "preferred" and category == "medicine":
-            return "medium"
-
-        # preferred + clothes → low
-        if urgency == "preferred" and category == "clothes":
-            return "low"
-
-        # preferred + fancy → low
-        if urgency == "preferred" and category == "fancy":
-            return "low"
-
         # flexible + any → low
         if urgency == "flexible":
             return "low"
 
-        # Fallback (should not reach here with valid inputs)
-        return None
+        # None for unknown combinations (should not happen with valid inputs)
+        return _PRIORITY_TABLE.get((urgency, category))
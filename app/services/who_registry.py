@@ -6,11 +6,11 @@ Used for Zero-Knowledge verification of medical package claims.
 """
 
 # WHO approved medical product types
-# This simulates a trusted authority registry
-WHO_APPROVED_PRODUCTS = {
+# This simulates a trusted authority registry (read-only)
+WHO_APPROVED_PRODUCTS = frozenset({
     "antibiotics",
     "vaccines",
     "first_aid",
     "medical_kit",
     "surgical_supplies",
-}
+})
@@ -40,12 +40,7 @@ class ZKVerifier:
         if not claimed_product_type or not isinstance(claimed_product_type, str):
             return False
 
-        # Normalize to lowercase for comparison
-        normalized_claim = claimed_product_type.lower().strip()
-
-        # Check against WHO approved products
+        # Normalize to lowercase and check against WHO approved products
         # This simulates verification against a trusted authority
         # No sensitive data is revealed in this process
-        is_verified = normalized_claim in WHO_APPROVED_PRODUCTS
-
-        return is_verified
+        return claimed_product_type.lower().strip() in WHO_APPROVED_PRODUCTS
@@ -0,0 +1,60 @@
+"""
+Shared pytest fixtures for the root test_*.py scripts.
+
+Tests that use the base_url/http_session/pkg_uuid fixtures talk to a
+running server; they are skipped when it is unreachable or has no packages.
+Set BASE_URL to point them at another host (default http://localhost:8001).
+
+Tests that use stub_db run in-process against tests.asgi_client with an
+in-memory database and need no server.
+"""
+
+import os
+
+import pytest
+import requests
+
+from app.core.cache import invalidate
+from app.core.database import get_db
+from app.main import app
+from tests.http_client import session
+from tests.pkg_fixture import first_pkg_uuid
+from tests.stub_db import StubDB
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    """Server under test."""
+    return os.environ.get("BASE_URL", "http://localhost:8001")
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """The pooled requests.Session shared with the scripts."""
+    return session
+
+
+@pytest.fixture(scope="session")
+def pkg_uuid(base_url):
+    """UUID of a package to exercise, fetched once per worker."""
+    try:
+        uuid = first_pkg_uuid(base_url)
+    except requests.ConnectionError:
+        pytest.skip(f"No server reachable at {base_url}")
+    if uuid is None:
+        pytest.skip(
+            f"No packages available from {base_url} "
+            "(list request failed or returned none). Run the seed endpoint first."
+        )
+    return uuid
+
+
+@pytest.fixture
+def stub_db():
+    """In-memory database served to the app via get_db, with an empty list cache."""
+    db = StubDB({"packages": []})
+    app.dependency_overrides[get_db] = lambda: db
+    invalidate("packages")
+    yield db
+    app.dependency_overrides.pop(get_db, None)
+    invalidate("packages")
@@ -0,0 +1,14 @@
+-- Per-status package counts for the dashboard metrics endpoint.
+--
+-- Lets GET /api/dashboard/metrics fetch every count in a single
+-- round-trip (one GROUP BY pass) instead of one count query per status.
+
+create or replace function public.package_status_counts()
+returns table (status text, count bigint)
+language sql
+stable
+as $$
+    select p.status::text, count(*)::bigint
+    from public.packages p
+    group by p.status;
+$$;
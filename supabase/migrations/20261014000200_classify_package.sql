@@ -0,0 +1,42 @@
+-- Single round-trip classification update for a package.
+--
+-- Used by POST/PATCH /api/packages/{id}/process and /{id}/category.
+-- The API computes the category (and the priority label for every
+-- possible urgency) in Python; this function applies the signal fields,
+-- picks the priority label matching the row's stored urgency and
+-- returns the updated row, so no pre-fetch of the package is needed.
+--
+-- p_signals:    jsonb object with any of weight, fragile, sender_type,
+--               zk_verified_sender; keys that are absent are left unchanged
+-- p_category:   category to store (may be null)
+-- p_priorities: jsonb object mapping urgency -> priority label
+--
+-- Returns no rows if the package does not exist or has no urgency.
+
+create or replace function public.classify_package(
+    p_id uuid,
+    p_signals jsonb,
+    p_category text,
+    p_priorities jsonb
+)
+returns setof public.packages
+language sql
+volatile
+as $$
+    update public.packages p
+    set
+        weight = case when p_signals ? 'weight'
+            then (p_signals->>'weight')::double precision else p.weight end,
+        fragile = case when p_signals ? 'fragile'
+            then (p_signals->>'fragile')::boolean else p.fragile end,
+        sender_type = case when p_signals ? 'sender_type'
+            then p_signals->>'sender_type' else p.sender_type end,
+        zk_verified_sender = case when p_signals ? 'zk_verified_sender'
+            then (p_signals->>'zk_verified_sender')::boolean else p.zk_verified_sender end,
+        category = p_category,
+        priority_label = p_priorities->>(p.urgency::text),
+        last_updated = now()
+    where p.id = p_id
+      and p.urgency is not null
+    returning p.*;
+$$;
@@ -0,0 +1,28 @@
+-- Let Postgres own the write timestamps.
+--
+-- packages.last_updated and receipts.timestamp default to now() on
+-- insert, and a BEFORE UPDATE trigger bumps packages.last_updated on
+-- every update, so the API no longer sends either field.
+
+alter table public.packages
+    alter column last_updated set default now();
+
+alter table public.receipts
+    alter column "timestamp" set default now();
+
+create or replace function public.touch_last_updated()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.last_updated := now();
+    return new;
+end;
+$$;
+
+drop trigger if exists packages_touch_last_updated on public.packages;
+
+create trigger packages_touch_last_updated
+    before update on public.packages
+    for each row
+    execute function public.touch_last_updated();
@@ -0,0 +1,23 @@
+-- Store disaster_type on receipts and derive harm_score in Postgres.
+--
+-- harm_score is a generated column, so it is computed once at insert
+-- time and returned in the RETURNING row. The mapping mirrors
+-- HarmScoreCalculator.calculate() in app/services/harm_score.py; keep
+-- the two in sync. btrim strips the same ASCII whitespace as Python's
+-- str.strip() (\x0B is \v; E-strings have no \v escape).
+
+alter table public.receipts
+    add column if not exists disaster_type text;
+
+alter table public.receipts
+    add column if not exists harm_score integer
+    generated always as (
+        case lower(btrim(disaster_type, E' \t\n\r\f\x0B'))
+            when 'earthquake' then 95
+            when 'flood' then 90
+            when 'cyclone' then 85
+            when 'landslide' then 80
+            when 'storm' then 70
+            else 10
+        end
+    ) stored;
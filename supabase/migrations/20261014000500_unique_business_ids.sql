@@ -0,0 +1,12 @@
+-- Unique business identifiers for packages and receipts.
+--
+-- Backs the 409 responses on duplicate package_id / receipt_id and lets
+-- the seed endpoints insert with ON CONFLICT (...) DO NOTHING, via
+-- PostgREST upsert(on_conflict=..., ignore_duplicates=True), instead of
+-- checking for existing rows first.
+
+create unique index if not exists packages_package_id_key
+    on public.packages (package_id);
+
+create unique index if not exists receipts_receipt_id_key
+    on public.receipts (receipt_id);
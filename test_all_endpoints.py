@@ -1,18 +1,18 @@
 """Test all update endpoints to find the 500 error."""
-import requests
 import json
 
+from tests.http_client import session
+from tests.pkg_fixture import first_pkg_uuid
+
 BASE_URL = "http://localhost:8001"
 
-# Get packages
-resp = requests.get(f"{BASE_URL}/api/packages")
-packages = resp.json()['packages']
+# Get first package
+pkg_uuid = first_pkg_uuid(BASE_URL)
 
-if not packages:
+if pkg_uuid is None:
     print("No packages")
     exit()
 
-pkg_uuid = packages[0]['id']
 print(f"Testing with package: {pkg_uuid}\n")
 
 tests = [
@@ -28,9 +28,9 @@ for name, method, path, payload in tests:
     print(f"Testing {name}")
     try:
         if method == "PATCH":
-            resp = requests.patch(f"{BASE_URL}{path}", json=payload)
+            resp = session.patch(f"{BASE_URL}{path}", json=payload)
         else:
-            resp = requests.post(f"{BASE_URL}{path}", json=payload)
+            resp = session.post(f"{BASE_URL}{path}", json=payload)
         
         if resp.status_code == 200:
             print(f"  ✓ 200 OK")
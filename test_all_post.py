@@ -1,21 +1,21 @@
 """Test all package endpoints with POST method."""
-import requests
 import json
 
-# Get packages
-resp = requests.get('http://localhost:8000/api/packages')
-packages = resp.json()['packages']
+from tests.http_client import session
+from tests.pkg_fixture import first_pkg_uuid
 
-if not packages:
+# Get first package
+pkg_uuid = first_pkg_uuid('http://localhost:8000')
+
+if pkg_uuid is None:
     print("No packages found.")
     exit()
 
-pkg_uuid = packages[0]['id']
 print(f"Testing with package UUID: {pkg_uuid}\n")
 
 # Test 1: POST to /{package_uuid} (status update)
 print("1. Testing POST /{package_uuid} (status update):")
-resp = requests.post(
+resp = session.post(
     f'http://localhost:8000/api/packages/{pkg_uuid}',
     json={"status": "in_transit"}
 )
@@ -27,7 +27,7 @@ else:
 
 # Test 2: POST to /{package_uuid}/process (signal processing)
 print("\n2. Testing POST /{package_uuid}/process (signal processing):")
-resp = requests.post(
+resp = session.post(
     f'http://localhost:8000/api/packages/{pkg_uuid}/process',
     json={
         "weight": 3.0,
@@ -44,7 +44,7 @@ else:
 
 # Test 3: POST to /{package_uuid}/category (category update)
 print("\n3. Testing POST /{package_uuid}/category (category update):")
-resp = requests.post(
+resp = session.post(
     f'http://localhost:8000/api/packages/{pkg_uuid}/category',
     json={"category": "medicine"}
 )
@@ -0,0 +1,50 @@
+"""Test the opaque keyset-pagination cursor (no server needed)."""
+import base64
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers._cursor import decode_cursor, encode_cursor, keyset_filter
+
+STAMP = datetime(2026, 10, 14, 10, 0, tzinfo=timezone.utc)
+
+
+def raw_cursor(text):
+    """Build a cursor from raw text, bypassing encode_cursor's checks."""
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+def test_round_trip():
+    """decode_cursor returns what encode_cursor packed."""
+    row_id = str(uuid.uuid4())
+    assert decode_cursor(encode_cursor(STAMP, row_id)) == (STAMP, row_id)
+
+
+def test_filter_quotes_both_values():
+    """The or= filter compares (column, id) against the quoted cursor values."""
+    row_id = str(uuid.uuid4())
+    ts = STAMP.isoformat()
+    assert keyset_filter("last_updated", encode_cursor(STAMP, row_id)) == (
+        f'last_updated.lt."{ts}",and(last_updated.eq."{ts}",id.lt."{row_id}")'
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        # Tries to close the quoted id and append its own filter
+        raw_cursor('2026-10-14T10:00:00+00:00|x"),status.eq.(y'),
+        # No UTC offset: the eq tiebreak would follow the database time zone
+        raw_cursor(f"2026-10-14T10:00:00|{uuid.uuid4()}"),
+        raw_cursor("2026-10-14T10:00:00+00:00"),
+        "not base64!",
+    ],
+    ids=["injected-id", "naive-timestamp", "no-id", "not-base64"],
+)
+def test_malformed_cursor_is_400(cursor):
+    """Malformed cursors are rejected before any filter is built."""
+    with pytest.raises(HTTPException) as excinfo:
+        keyset_filter("last_updated", cursor)
+    assert excinfo.value.status_code == 400
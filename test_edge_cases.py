@@ -1,18 +1,19 @@
 """Test various payloads to reproduce the 500 error."""
-import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.http_client import session, warm
+from tests.pkg_fixture import first_pkg_uuid
 
 BASE_URL = "http://localhost:8001"
 
-# Get packages
-resp = requests.get(f"{BASE_URL}/api/packages")
-packages = resp.json()['packages']
+# Get first package
+pkg_uuid = first_pkg_uuid(BASE_URL)
 
-if not packages:
+if pkg_uuid is None:
     print("No packages")
     exit()
 
-pkg_uuid = packages[0]['id']
 print(f"Testing with package: {pkg_uuid}\n")
 
 # Test different payloads that might cause 500
@@ -24,15 +25,27 @@ test_payloads = [
     {"payload": None, "name": "No body"},
 ]
 
-for test in test_payloads:
+
+def send(test):
+    """POST one edge-case payload (no body at all when payload is None)."""
+    if test['payload'] is None:
+        return session.post(f"{BASE_URL}/api/packages/{pkg_uuid}")
+    return session.post(f"{BASE_URL}/api/packages/{pkg_uuid}", json=test['payload'])
+
+
+# Have one pooled connection ready per payload before the burst
+warm(BASE_URL, len(test_payloads))
+
+# The payloads are independent, so send them all at once and report in order
+with ThreadPoolExecutor(max_workers=len(test_payloads)) as pool:
+    futures = [pool.submit(send, test) for test in test_payloads]
+
+for test, future in zip(test_payloads, futures):
     print(f"Test: {test['name']}")
     print(f"Payload: {test['payload']}")
     
     try:
-        if test['payload'] is None:
-            resp = requests.post(f"{BASE_URL}/api/packages/{pkg_uuid}")
-        else:
-            resp = requests.post(f"{BASE_URL}/api/packages/{pkg_uuid}", json=test['payload'])
+        resp = future.result()
         
         print(f"Status: {resp.status_code}")
         if resp.status_code != 200:
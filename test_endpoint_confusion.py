@@ -1,59 +1,87 @@
 """Test to understand what the frontend is doing wrong."""
-import requests
-import json
+import asyncio
 
-BASE_URL = "http://localhost:8001"
-
-# Get packages
-resp = requests.get(f"{BASE_URL}/api/packages")
-packages = resp.json()['packages']
+import httpx
+import orjson
 
-if not packages:
-    print("No packages")
-    exit()
+from tests.cassettes import activate
 
-pkg_uuid = packages[0]['id']
-print(f"Package UUID: {pkg_uuid}\n")
+BASE_URL = "http://localhost:8001"
 
-# Test 1: The payload frontend is sending (to WRONG endpoint)
-print("Test 1: Frontend sending signals payload to status update endpoint (WRONG)")
+# The payload frontend is sending
 wrong_payload = {
     "weight": 45,
     "fragile": False,
     "sender_type": "business",
     "claimed_product_type": "medical"
 }
-print(f"Endpoint: PATCH /api/packages/{pkg_uuid}")
-print(f"Payload: {json.dumps(wrong_payload, indent=2)}")
-
-resp = requests.patch(f"{BASE_URL}/api/packages/{pkg_uuid}", json=wrong_payload)
-print(f"Status: {resp.status_code}")
-if resp.status_code != 200:
-    print(f"Error: {resp.json()['detail']}")
-print()
-
-# Test 2: The RIGHT endpoint for signals
-print("Test 2: Sending signals to CORRECT endpoint (/process)")
-print(f"Endpoint: PATCH /api/packages/{pkg_uuid}/process")
-print(f"Payload: {json.dumps(wrong_payload, indent=2)}")
-
-resp = requests.patch(f"{BASE_URL}/api/packages/{pkg_uuid}/process", json=wrong_payload)
-print(f"Status: {resp.status_code}")
-if resp.status_code == 200:
-    print(f"✓ Success! Category: {resp.json()['category']}")
-else:
-    print(f"Error: {resp.json()['detail']}")
-print()
-
-# Test 3: Correct status update endpoint
-print("Test 3: Correct status update to status endpoint")
 status_payload = {"status": "in_transit"}
-print(f"Endpoint: PATCH /api/packages/{pkg_uuid}")
-print(f"Payload: {json.dumps(status_payload, indent=2)}")
-
-resp = requests.patch(f"{BASE_URL}/api/packages/{pkg_uuid}", json=status_payload)
-print(f"Status: {resp.status_code}")
-if resp.status_code == 200:
-    print(f"✓ Success!")
-else:
-    print(f"Error: {resp.json()['detail']}")
+
+# Encode once: the same body goes to two endpoints
+JSON_HEADERS = {"Content-Type": "application/json"}
+wrong_body = orjson.dumps(wrong_payload)
+status_body = orjson.dumps(status_payload)
+wrong_pretty = orjson.dumps(wrong_payload, option=orjson.OPT_INDENT_2).decode()
+status_pretty = orjson.dumps(status_payload, option=orjson.OPT_INDENT_2).decode()
+
+
+async def main():
+    """Fire the three independent PATCHes together, then report them in order."""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, http2=True, timeout=httpx.Timeout(5.0, connect=2.0)
+    ) as client:
+        # Get first package
+        resp = await client.get("/api/packages", params={"limit": 1})
+        packages = resp.json().get('packages') if resp.status_code == 200 else None
+
+        if not packages:
+            print(f"No packages ({resp.status_code})")
+            return
+
+        pkg_uuid = packages[0]['id']
+        print(f"Package UUID: {pkg_uuid}\n")
+
+        # None of the tests depends on another's response
+        resp1, resp2, resp3 = await asyncio.gather(
+            client.patch(f"/api/packages/{pkg_uuid}", content=wrong_body, headers=JSON_HEADERS),
+            client.patch(f"/api/packages/{pkg_uuid}/process", content=wrong_body, headers=JSON_HEADERS),
+            client.patch(f"/api/packages/{pkg_uuid}", content=status_body, headers=JSON_HEADERS),
+        )
+
+    # Test 1: The payload frontend is sending (to WRONG endpoint)
+    print("Test 1: Frontend sending signals payload to status update endpoint (WRONG)")
+    print(f"Endpoint: PATCH /api/packages/{pkg_uuid}")
+    print(f"Payload: {wrong_pretty}")
+
+    print(f"Status: {resp1.status_code}")
+    if resp1.status_code != 200:
+        print(f"Error: {resp1.json()['detail']}")
+    print()
+
+    # Test 2: The RIGHT endpoint for signals
+    print("Test 2: Sending signals to CORRECT endpoint (/process)")
+    print(f"Endpoint: PATCH /api/packages/{pkg_uuid}/process")
+    print(f"Payload: {wrong_pretty}")
+
+    print(f"Status: {resp2.status_code}")
+    if resp2.status_code == 200:
+        print(f"✓ Success! Category: {resp2.json()['category']}")
+    else:
+        print(f"Error: {resp2.json()['detail']}")
+    print()
+
+    # Test 3: Correct status update endpoint
+    print("Test 3: Correct status update to status endpoint")
+    print(f"Endpoint: PATCH /api/packages/{pkg_uuid}")
+    print(f"Payload: {status_pretty}")
+
+    print(f"Status: {resp3.status_code}")
+    if resp3.status_code == 200:
+        print(f"✓ Success!")
+    else:
+        print(f"Error: {resp3.json()['detail']}")
+
+
+if __name__ == "__main__":
+    activate()
+    asyncio.run(main())
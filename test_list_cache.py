@@ -0,0 +1,130 @@
+"""Test the packages list cache and conditional GET (in-process, no server needed)."""
+import asyncio
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.cache import invalidate
+from tests.asgi_client import asgi_client
+from tests.stub_db import package_row
+
+STAMP = datetime(2026, 10, 14, 10, 0, tzinfo=timezone.utc)
+CONCURRENT_REQUESTS = 5
+
+
+@pytest.fixture
+def seeded_db(stub_db):
+    """Stub database holding a few packages."""
+    stub_db.tables["packages"] = [package_row(f"CACHE-{i}", STAMP) for i in range(3)]
+    return stub_db
+
+
+async def wait_for_queries(db, count):
+    """Yield to the event loop until db has started count queries."""
+    while db.executed < count:
+        await asyncio.sleep(0)
+
+
+def test_concurrent_misses_share_one_query(seeded_db):
+    """Requests arriving while a fetch is in flight join it instead of querying again."""
+
+    async def scenario():
+        seeded_db.gate = asyncio.Event()
+        async with asgi_client(lifespan=False) as client:
+            requests = [
+                asyncio.ensure_future(client.get("/api/packages"))
+                for _ in range(CONCURRENT_REQUESTS)
+            ]
+            await wait_for_queries(seeded_db, 1)
+            # Let every request reach the cache before the query returns
+            await asyncio.sleep(0.05)
+            seeded_db.gate.set()
+            responses = await asyncio.gather(*requests)
+            # Now cached: another request issues no query
+            responses.append(await client.get("/api/packages"))
+        return responses
+
+    responses = asyncio.run(scenario())
+
+    assert seeded_db.executed == 1
+    assert {resp.status_code for resp in responses} == {200}
+    assert len({resp.content for resp in responses}) == 1
+
+
+def test_invalidate_during_fetch_is_not_cached(seeded_db):
+    """A fetch that started before a write must not be cached after it."""
+
+    async def scenario():
+        seeded_db.gate = asyncio.Event()
+        async with asgi_client(lifespan=False) as client:
+            stale = asyncio.ensure_future(client.get("/api/packages"))
+            await wait_for_queries(seeded_db, 1)
+            # A write lands while the first query is in flight
+            invalidate("packages")
+            seeded_db.gate.set()
+            assert (await stale).status_code == 200
+            assert (await client.get("/api/packages")).status_code == 200
+
+    asyncio.run(scenario())
+
+    assert seeded_db.executed == 2
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        "{etag}",
+        "{opaque}",
+        '"not-it", {etag}',
+        "*",
+    ],
+    ids=["weak", "strong-form", "list", "star"],
+)
+def test_matching_etag_is_304(seeded_db, if_none_match):
+    """If-None-Match is compared weakly and may list several tags."""
+
+    async def scenario():
+        async with asgi_client(lifespan=False) as client:
+            first = await client.get("/api/packages")
+            etag = first.headers["etag"]
+            header = if_none_match.format(etag=etag, opaque=etag.removeprefix("W/"))
+            again = await client.get("/api/packages", headers={"If-None-Match": header})
+        return etag, again
+
+    etag, again = asyncio.run(scenario())
+
+    assert etag.startswith('W/"')
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+
+def test_other_etag_is_200(seeded_db):
+    """A stale tag gets the full body."""
+
+    async def scenario():
+        async with asgi_client(lifespan=False) as client:
+            return await client.get("/api/packages", headers={"If-None-Match": 'W/"stale"'})
+
+    resp = asyncio.run(scenario())
+
+    assert resp.status_code == 200
+    assert resp.json()["count"] == 3
+
+
+def test_malformed_cursor_is_400(stub_db):
+    """A tampered cursor is rejected before any query runs."""
+    cursor = base64.urlsafe_b64encode(
+        b'2026-10-14T10:00:00+00:00|x"),status.eq.(y'
+    ).decode()
+
+    async def scenario():
+        async with asgi_client(lifespan=False) as client:
+            return await client.get("/api/packages", params={"cursor": cursor})
+
+    resp = asyncio.run(scenario())
+
+    assert resp.status_code == 400, resp.text
+    assert resp.json()["detail"] == "Invalid pagination cursor"
+    assert stub_db.executed == 0
@@ -0,0 +1,43 @@
+"""Test keyset pagination over packages that share one last_updated (in-process, no server needed)."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from tests.asgi_client import asgi_client
+from tests.stub_db import package_row
+
+BATCH_SIZE = 5
+PAGE_SIZE = 2
+STAMP = datetime(2026, 10, 14, 10, 0, tzinfo=timezone.utc)
+
+
+def test_pages_through_shared_timestamp(stub_db):
+    """A bulk insert stamps every row with the same now(); paging must still return each once."""
+    batch = [package_row(f"PAGE-{i}", STAMP) for i in range(BATCH_SIZE)]
+    older = [package_row(f"OLD-{i}", STAMP - timedelta(hours=i + 1)) for i in range(3)]
+    stub_db.tables["packages"] = batch + older
+    wanted = {row['package_id'] for row in batch}
+
+    async def page_until_batch_seen():
+        seen = []
+        cursor = None
+        async with asgi_client(lifespan=False) as client:
+            # The batch is newest, so it fills the first pages; stop once it is all seen
+            for _ in range(BATCH_SIZE):
+                params = {"limit": PAGE_SIZE}
+                if cursor:
+                    params["cursor"] = cursor
+                page = await client.get("/api/packages", params=params)
+                assert page.status_code == 200, page.text
+                data = page.json()
+                seen += [pkg['package_id'] for pkg in data['packages']]
+                cursor = data['next_cursor']
+                if wanted <= set(seen) or not cursor:
+                    break
+        return seen
+
+    seen = asyncio.run(page_until_batch_seen())
+
+    assert len(seen) == len(set(seen)), "a package was returned on two pages"
+    assert wanted <= set(seen), f"missing from pages: {wanted - set(seen)}"
+    # The older rows sort after the whole batch
+    assert set(seen[:BATCH_SIZE]) == wanted
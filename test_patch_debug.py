@@ -1,28 +1,36 @@
 """Test PATCH with detailed error output."""
-import requests
+import asyncio
 import json
 
-BASE_URL = "http://localhost:8001"
+from tests.asgi_client import asgi_client
 
-# Get first package
-resp = requests.get(f"{BASE_URL}/api/packages")
-packages = resp.json()['packages']
 
-if not packages:
-    print("No packages found")
-    exit()
+async def main():
+    """Send one status PATCH in-process (no running server needed) and dump the full response."""
+    async with asgi_client() as client:
+        # Get first package
+        resp = await client.get('/api/packages', params={"limit": 1})
+        packages = resp.json().get('packages') if resp.status_code == 200 else None
 
-pkg_uuid = packages[0]['id']
-print(f"Testing PATCH with package UUID: {pkg_uuid}\n")
+        if not packages:
+            print(f"No packages found ({resp.status_code})")
+            return
 
-# Test with simple valid status
-print("Testing PATCH with simple status:")
-resp = requests.patch(
-    f"{BASE_URL}/api/packages/{pkg_uuid}",
-    json={"status": "in_transit"}
-)
+        pkg_uuid = packages[0]['id']
+        print(f"Testing PATCH with package UUID: {pkg_uuid}\n")
 
-print(f"Status Code: {resp.status_code}")
-print(f"Response Headers: {dict(resp.headers)}")
-print(f"Response Body:")
-print(json.dumps(resp.json(), indent=2))
+        # Test with simple valid status
+        print("Testing PATCH with simple status:")
+        resp = await client.patch(
+            f"/api/packages/{pkg_uuid}",
+            json={"status": "in_transit"}
+        )
+
+    print(f"Status Code: {resp.status_code}")
+    print(f"Response Headers: {dict(resp.headers)}")
+    print(f"Response Body:")
+    print(json.dumps(resp.json(), indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
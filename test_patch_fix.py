@@ -1,66 +1,59 @@
 """Test the PATCH endpoint with flexible status validation."""
-import requests
-import json
+import pytest
 
-BASE_URL = "http://localhost:8001"
-
-# Get first package
-resp = requests.get(f"{BASE_URL}/api/packages")
-packages = resp.json()['packages']
-
-if not packages:
-    print("No packages found")
-    exit()
+from tests.http_client import session
+from tests.pkg_fixture import first_pkg_uuid
 
-pkg_uuid = packages[0]['id']
-print(f"Testing PATCH with package UUID: {pkg_uuid}\n")
-
-# Test 1: Valid status (lowercase)
-print("1. Testing PATCH with valid status (in_transit):")
-resp = requests.patch(
-    f"{BASE_URL}/api/packages/{pkg_uuid}",
-    json={"status": "in_transit"}
-)
-print(f"   Status Code: {resp.status_code}")
-if resp.status_code != 200:
-    print(f"   Error: {resp.json()}")
-else:
-    print(f"   ✓ Success")
+BASE_URL = "http://localhost:8001"
 
-# Test 2: Valid status (mixed case)
-print("\n2. Testing PATCH with mixed case status (DELIVERED):")
-resp = requests.patch(
-    f"{BASE_URL}/api/packages/{pkg_uuid}",
-    json={"status": "DELIVERED"}
-)
-print(f"   Status Code: {resp.status_code}")
-if resp.status_code != 200:
-    print(f"   Error: {resp.json()}")
-else:
-    print(f"   ✓ Success")
+# (description, payload, expected status code)
+test_cases = [
+    ("valid status (in_transit)", {"status": "in_transit"}, 200),
+    ("mixed case status (DELIVERED)", {"status": "DELIVERED"}, 200),
+    ("spaces ( delayed )", {"status": " delayed "}, 200),
+    ("invalid status (should fail)", {"status": "invalid_status"}, 422),
+]
 
-# Test 3: Valid status with extra spaces
-print("\n3. Testing PATCH with spaces ( delayed ):")
-resp = requests.patch(
-    f"{BASE_URL}/api/packages/{pkg_uuid}",
-    json={"status": " delayed "}
-)
-print(f"   Status Code: {resp.status_code}")
-if resp.status_code != 200:
-    print(f"   Error: {resp.json()}")
-else:
-    print(f"   ✓ Success")
 
-# Test 4: Invalid status
-print("\n4. Testing PATCH with invalid status (should fail):")
-resp = requests.patch(
-    f"{BASE_URL}/api/packages/{pkg_uuid}",
-    json={"status": "invalid_status"}
+@pytest.mark.parametrize(
+    "payload,expected_status",
+    [(payload, expected) for _, payload, expected in test_cases],
+    ids=[name for name, _, _ in test_cases],
 )
-print(f"   Status Code: {resp.status_code}")
-if resp.status_code == 422:
-    print(f"   ✓ Correctly rejected with validation error")
-else:
-    print(f"   Response: {resp.json()}")
-
-print("\n✅ Tests completed!")
+def test_patch_status(payload, expected_status, pkg_uuid, base_url, http_session):
+    """Status values are normalised case- and whitespace-insensitively; unknown ones get 422."""
+    resp = http_session.patch(f"{base_url}/api/packages/{pkg_uuid}", json=payload)
+    assert resp.status_code == expected_status, resp.text
+
+
+def main():
+    """Run every case in order and print a report."""
+    # Get first package
+    pkg_uuid = first_pkg_uuid(BASE_URL)
+
+    if pkg_uuid is None:
+        print("No packages found")
+        return
+
+    print(f"Testing PATCH with package UUID: {pkg_uuid}\n")
+
+    for i, (name, payload, expected) in enumerate(test_cases, start=1):
+        prefix = "\n" if i > 1 else ""
+        print(f"{prefix}{i}. Testing PATCH with {name}:")
+        resp = session.patch(f"{BASE_URL}/api/packages/{pkg_uuid}", json=payload)
+        print(f"   Status Code: {resp.status_code}")
+        if expected == 422:
+            if resp.status_code == 422:
+                print(f"   ✓ Correctly rejected with validation error")
+            else:
+                print(f"   Response: {resp.json()}")
+        elif resp.status_code != 200:
+            print(f"   Error: {resp.json()}")
+        else:
+            print(f"   ✓ Success")
+
+    print("\n✅ Tests completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,13 @@
 """Test the process endpoint with POST method."""
-import requests
 import json
 
+from tests.http_client import session
+from tests.pkg_fixture import first_pkg_uuid
+
 # Get a package UUID from the list first
-resp = requests.get('http://localhost:8000/api/packages')
-packages = resp.json()['packages']
+package_uuid = first_pkg_uuid('http://localhost:8000')
 
-if packages:
-    package_uuid = packages[0]['id']
+if package_uuid is not None:
     print(f"Testing with package UUID: {package_uuid}")
     
     # Test POST method (the one used by frontend)
@@ -18,7 +18,7 @@ if packages:
         "claimed_product_type": "medical_supplies"
     }
     
-    resp = requests.post(
+    resp = session.post(
         f'http://localhost:8000/api/packages/{package_uuid}/process',
         json=payload
     )
@@ -1,12 +1,13 @@
 """Quick test script for seed endpoint."""
-import requests
 import json
 
+from tests.http_client import session
+
 # Test seed endpoint
 url = "http://localhost:8000/api/seed/packages"
 
 try:
-    response = requests.post(url)
+    response = session.post(url)
     print(f"Status Code: {response.status_code}")
     print(f"Response:\n{json.dumps(response.json(), indent=2)}")
 except Exception as e:
@@ -0,0 +1 @@
+"""Shared helpers for the manual test_*.py scripts at the repository root."""
@@ -0,0 +1,24 @@
+"""
+In-process client for the FastAPI app.
+
+Runs the app's lifespan (Supabase client setup and teardown) and routes
+requests straight into the ASGI app, so scripts using it need no uvicorn
+process and no free port. Tests that swap get_db for a stub skip the
+lifespan so a configured .env is never contacted.
+"""
+
+from contextlib import asynccontextmanager, nullcontext
+
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+
+
+@asynccontextmanager
+async def asgi_client(lifespan: bool = True):
+    """Yield an AsyncClient bound to the app, with startup/shutdown run around it if lifespan."""
+    async with app.router.lifespan_context(app) if lifespan else nullcontext():
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
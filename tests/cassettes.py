@@ -0,0 +1,55 @@
+"""
+Optional VCR-style record/replay for the manual test scripts.
+
+Set CASSETTE=record to capture a script's HTTP traffic to
+tests/cassettes/<script>.yaml, then CASSETTE=replay to serve the same
+responses with no server running. With CASSETTE unset nothing is patched.
+
+Requires vcrpy (pip install -r requirements-dev.txt); it is a developer tool, not a
+runtime dependency.
+"""
+
+import atexit
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+# CASSETTE value → vcrpy record mode
+_RECORD_MODES = {"record": "all", "replay": "none"}
+
+_active = False
+
+
+def activate(name: Optional[str] = None) -> None:
+    """
+    Start recording or replaying HTTP traffic for the rest of the process.
+
+    Args:
+        name: Cassette name (defaults to the running script's file name)
+
+    Raises:
+        ValueError: If CASSETTE is set to an unknown mode
+    """
+    global _active
+    mode = os.environ.get("CASSETTE")
+    if not mode or _active:
+        return
+    if mode not in _RECORD_MODES:
+        raise ValueError(
+            f"Invalid CASSETTE '{mode}'. Must be one of: {', '.join(_RECORD_MODES)}"
+        )
+
+    import vcr
+
+    recorder = vcr.VCR(
+        cassette_library_dir=str(CASSETTE_DIR),
+        record_mode=_RECORD_MODES[mode],
+        match_on=("method", "uri", "body"),
+    )
+    cassette = recorder.use_cassette(f"{name or Path(sys.argv[0]).stem}.yaml")
+    cassette.__enter__()
+    atexit.register(cassette.__exit__, None, None, None)
+    _active = True
@@ -0,0 +1,74 @@
+"""
+Pooled HTTP session shared by the manual test scripts.
+
+Importing this module only creates the session (and, when CASSETTE is
+set, starts record/replay; see tests.cassettes); every script that uses
+it reuses the same keep-alive connections instead of opening one per call.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tests.cassettes import activate
+
+activate()
+
+# (connect, read) seconds for any call that does not pass its own timeout
+DEFAULT_TIMEOUT = (2, 5)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies DEFAULT_TIMEOUT instead of waiting forever."""
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+# Sized for parallel runs (thread pools, pytest-xdist workers);
+# pool_block makes extra callers wait for a free connection rather than
+# opening throwaway ones. Retry only covers idempotent methods (urllib3 default).
+adapter = _TimeoutHTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    pool_block=True,
+    max_retries=Retry(total=3, backoff_factor=0.1),
+)
+
+session = requests.Session()
+session.mount("http://", adapter)
+session.mount("https://", adapter)
+session.headers["Connection"] = "keep-alive"
+
+
+def warm(base_url: str, connections: int = 1) -> None:
+    """
+    Open pooled connections up front so a timed burst does not pay for connects.
+
+    Args:
+        base_url: Server to connect to (GET / is cheap and has no side effects)
+        connections: How many connections to open concurrently
+    """
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        list(pool.map(lambda _: session.get(f"{base_url}/"), range(connections)))
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """
+    Report connection usage per host pool.
+
+    Returns:
+        {"scheme://host:port": {"connections": opened, "requests": sent}}
+    """
+    stats = {}
+    for key in adapter.poolmanager.pools.keys():
+        pool = adapter.poolmanager.pools[key]
+        stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+            "connections": pool.num_connections,
+            "requests": pool.num_requests,
+        }
+    return stats
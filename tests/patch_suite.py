@@ -0,0 +1,31 @@
+"""
+Run the PATCH-related scripts in one process.
+
+test_patch_debug, test_patch_fix and test_business share one interpreter
+instead of paying startup and imports three times. test_patch_fix and
+test_business also share one pooled session and one memoized package
+lookup; test_patch_debug runs in-process against the ASGI app.
+
+Run from the repository root: python -m tests.patch_suite
+"""
+
+import asyncio
+
+import test_business
+import test_patch_debug
+import test_patch_fix
+
+SCRIPTS = (test_patch_debug, test_patch_fix, test_business)
+
+
+def main():
+    """Run each script's main() in order, awaiting the async ones."""
+    for script in SCRIPTS:
+        print(f"\n===== {script.__name__} =====\n")
+        result = script.main()
+        if asyncio.iscoroutine(result):
+            asyncio.run(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Bootstrap lookups shared by the manual test scripts.
+
+The first package UUID is fetched once per process and memoized, so
+scripts (or suites running several scripts) do not repeat the GET.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from tests.http_client import session
+
+
+@lru_cache(maxsize=None)
+def first_pkg_uuid(base_url: str) -> Optional[str]:
+    """
+    Return the UUID of the most recently updated package.
+
+    Returns None when there is none to use: the list request failed
+    (e.g. the database is down), or it returned no packages.
+    """
+    resp = session.get(f"{base_url}/api/packages", params={"limit": 1})
+    if resp.status_code != 200:
+        return None
+    packages = resp.json().get('packages')
+    return packages[0]['id'] if packages else None
@@ -0,0 +1,102 @@
+"""
+In-memory stand-in for the Supabase client, for in-process tests.
+
+Implements only the query-builder calls the list endpoints make
+(select, order, limit, the keyset or_ filter, execute), so tests can
+drive /api/packages through tests.asgi_client with no database. Install
+it with app.dependency_overrides[get_db].
+"""
+
+import asyncio
+import re
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Optional
+
+# The filter shape app.routers._cursor.keyset_filter builds
+_KEYSET_RE = re.compile(
+    r'(?P<col>\w+)\.lt\."(?P<ts>[^"]+)",and\((?P=col)\.eq\."(?P=ts)",id\.lt\."(?P<id>[^"]+)"\)'
+)
+
+
+def package_row(package_id: str, last_updated: datetime) -> dict:
+    """Build a packages row as Supabase would return it."""
+    return {
+        "id": str(uuid.uuid4()),
+        "package_id": package_id,
+        "destination": "Stub Destination",
+        "status": "in_transit",
+        "urgency": "flexible",
+        "last_updated": last_updated.isoformat(),
+    }
+
+
+class StubQuery:
+    """One select against a StubDB table."""
+
+    def __init__(self, db: "StubDB", table: str):
+        self._db = db
+        self._table = table
+        self._order: list[tuple[str, bool]] = []
+        self._limit: Optional[int] = None
+        self._after: Optional[tuple[str, datetime, str]] = None
+
+    def select(self, *columns, **kwargs) -> "StubQuery":
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "StubQuery":
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, size: int) -> "StubQuery":
+        self._limit = size
+        return self
+
+    def or_(self, filters: str) -> "StubQuery":
+        match = _KEYSET_RE.fullmatch(filters)
+        if match is None:
+            raise ValueError(f"StubQuery only understands keyset filters: {filters}")
+        self._after = (match["col"], datetime.fromisoformat(match["ts"]), match["id"])
+        return self
+
+    def _is_after_cursor(self, row: dict) -> bool:
+        column, timestamp, row_id = self._after
+        row_timestamp = datetime.fromisoformat(row[column])
+        return row_timestamp < timestamp or (
+            row_timestamp == timestamp and row["id"] < row_id
+        )
+
+    async def execute(self) -> SimpleNamespace:
+        self._db.executed += 1
+        if self._db.gate is not None:
+            await self._db.gate.wait()
+
+        rows = list(self._db.tables.get(self._table, []))
+        if self._after is not None:
+            rows = [row for row in rows if self._is_after_cursor(row)]
+        # Stable sorts applied last-key-first give the chained order
+        for column, desc in reversed(self._order):
+            rows.sort(key=lambda row: row[column], reverse=desc)
+        if self._limit is not None:
+            rows = rows[: self._limit]
+        return SimpleNamespace(data=[dict(row) for row in rows], count=None)
+
+
+class StubDB:
+    """
+    Tables of row dicts plus hooks for concurrency tests.
+
+    Attributes:
+        tables: Rows by table name
+        executed: Number of queries executed so far
+        gate: If set, every query waits on this event before returning
+    """
+
+    def __init__(self, tables: Optional[dict[str, list[dict]]] = None):
+        self.tables = tables or {}
+        self.executed = 0
+        self.gate: Optional[asyncio.Event] = None
+
+    def table(self, name: str) -> StubQuery:
+        return StubQuery(self, name)